@@ -15,24 +15,37 @@ Signals extracted:
     • Code quality heuristics
 
 Performance optimizations:
-    • LRU cache with 5-minute TTL
+    • LRU cache with 5-minute TTL (optional disk tier via GITHUB_CACHE_DIR)
+    • ETag revalidation (304s skip the body and the rate limit)
+    • Shared async HTTP client (HTTP/2 multiplexing when h2 is installed)
     • Parallel request execution (asyncio.gather)
     • Reduced commit depth (30 instead of 100)
-    • Skip tree fetch for small repos
+    • Full recursive tree in a single call (no per-directory fetches)
 """
 
 from __future__ import annotations
 
 import asyncio
+import bisect
+import hashlib
 import logging
 import os
 import re
+import sys
 import time
 from datetime import datetime, timezone
 from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
 import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
+
+try:
+    import diskcache
+except ImportError:  # optional persistent cache tier
+    diskcache = None
 
 from ai_scoring.models import DomainDetection, SourceType, VerificationSignal
 from ai_scoring.rules import (
@@ -49,31 +62,188 @@ logger = logging.getLogger("ai_scoring.github")
 
 GITHUB_API = "https://api.github.com"
 CACHE_TTL = 300  # 5 minutes
-SMALL_REPO_THRESHOLD = 50  # files
+CACHE_MAXSIZE = 1024  # repos
+ETAG_CACHE_BYTES = 64 * 1024 * 1024  # response bodies kept for revalidation
+DISK_CACHE_DIR = os.environ.get("GITHUB_CACHE_DIR")  # unset = memory only
+DISK_CACHE_TTL = 3600  # 1 hour
+DISK_CACHE_SIZE = 512 * 1024 * 1024  # bytes
+REQUEST_TIMEOUT = 15  # seconds
+MAX_CONCURRENT_REQUESTS = 10
+RATE_LIMIT_MIN_REMAINING = 2  # throttle before the budget hits zero
+MAX_RATE_LIMIT_WAIT = 60  # seconds; longer waits surface as rate-limit errors
+
+_REPO_RE = re.compile(r"(?:github\.com/)?([^/]+)/([^/]+)$")
+_SEGMENT_RE = re.compile(r"[A-Za-z0-9._-]+")
+
+# Repo fields copied verbatim into the analysis metadata, with defaults
+_META_KEYS = (
+    "full_name", "description", "default_branch", "created_at",
+    "updated_at", "pushed_at", "html_url", "topics",
+)
+_META_DEFAULTS: dict[str, Any] = dict.fromkeys(_META_KEYS[:-1], "")  # topics: fresh list per call
+_META_DEFAULTS["default_branch"] = "main"
+
+# Bucket tables: recency score by days since push (upper bounds inclusive)
+# and credibility label by overall score (lower bounds inclusive).
+_RECENCY_THRESHOLDS = (
+    GitHubWeights.RECENCY_EXCELLENT,
+    GitHubWeights.RECENCY_GOOD,
+    GitHubWeights.RECENCY_ACCEPTABLE,
+)
+_RECENCY_SCORES = (1.0, 0.7, 0.4, 0.1)
+_CREDIBILITY_THRESHOLDS = (0.3, 0.5, 0.7, 0.9)
+_CREDIBILITY_LABELS = ("Minimal", "Developing", "Moderate", "Strong", "Exceptional")
+
+# Inverted index keyword -> subdomains, so each distinct keyword is
+# searched once even when several subdomains share it ("pipeline").
+_KEYWORD_SUBDOMAINS: dict[str, tuple[str, ...]] = {}
+for _subdomain, _keywords in SUBDOMAIN_SIGNALS.items():
+    for _kw in dict.fromkeys(_keywords):
+        _KEYWORD_SUBDOMAINS[_kw] = _KEYWORD_SUBDOMAINS.get(_kw, ()) + (_subdomain,)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Cache
+# HTTP Client
 # ─────────────────────────────────────────────────────────────────────────────
-_cache: dict[str, tuple[dict[str, Any], float]] = {}
+# HTTP/2 needs the optional `h2` package (httpx[http2]); without it the
+# client falls back to pooled HTTP/1.1 keep-alive connections.
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 
-def _get_cached_analysis(repo_url: str) -> dict[str, Any] | None:
-    """Get cached analysis if still valid."""
-    if repo_url in _cache:
-        result, timestamp = _cache[repo_url]
-        if time.time() - timestamp < CACHE_TTL:
-            logger.debug("Cache hit for %s", repo_url)
-            return result
-        else:
-            del _cache[repo_url]
-    return None
+def _headers() -> dict[str, str]:
+    """Build request headers, optionally with auth token."""
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"token {token}"
+    return headers
+
+
+# One long-lived client per event loop: with HTTP/2 all parallel GitHub
+# calls are multiplexed over a single connection (one TCP + TLS handshake).
+# trust_env=False bypasses Windows proxy autodiscovery (registry)
+# which causes ConnectTimeout even when the network works fine.
+# Headers are read from the environment once, at import: picking up a new
+# GITHUB_TOKEN needs a process restart.
+_CLIENT_OPTIONS: dict[str, Any] = {
+    "http2": _HTTP2,
+    "headers": _headers(),
+    "timeout": REQUEST_TIMEOUT,
+    "limits": httpx.Limits(max_keepalive_connections=8, max_connections=16),
+    "trust_env": False,
+}
+
+# Async httpx has failed on Windows dev machines, so there requests go
+# through a sync client in worker threads instead (the pre-httpx
+# behaviour). Deployments run on Linux and stay on the event loop.
+_USE_SYNC_CLIENT = sys.platform == "win32"
+
+# Pooled connections and the request semaphore belong to the loop that
+# created them, so each new loop (another app lifespan, a script's
+# asyncio.run) gets its own; aclose() drops them for the next one.
+_client: httpx.AsyncClient | None = None
+_sync_client: httpx.Client | None = None
+_request_slots: asyncio.Semaphore | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _loop_state() -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    """Return the client and request semaphore for the running loop."""
+    global _client, _request_slots, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = httpx.AsyncClient(**_CLIENT_OPTIONS)
+        _request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        _client_loop = loop
+    return _client, _request_slots
+
+
+async def _send_get(url: str, headers: dict[str, str] | None) -> httpx.Response:
+    """Issue one GET on the shared client for this platform."""
+    global _sync_client
+    if _USE_SYNC_CLIENT:
+        if _sync_client is None:
+            _sync_client = httpx.Client(**_CLIENT_OPTIONS)
+        return await asyncio.to_thread(_sync_client.get, url, headers=headers)
+    return await _loop_state()[0].get(url, headers=headers)
+
+
+async def aclose() -> None:
+    """Close the shared HTTP clients; later requests open fresh ones.
+
+    Call on application shutdown, from the loop that served the requests.
+    """
+    global _client, _sync_client, _request_slots, _client_loop
+    client, loop = _client, _client_loop
+    _client = _request_slots = _client_loop = None
+    # A client from a finished loop cannot be closed from this one
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
+    sync_client, _sync_client = _sync_client, None
+    if sync_client is not None:
+        sync_client.close()
+
+
+def _auth_scope() -> str:
+    """Short fingerprint of the active token, used to scope persisted results."""
+    auth = _CLIENT_OPTIONS["headers"].get("Authorization")
+    return hashlib.sha256(auth.encode()).hexdigest()[:12] if auth else "anon"
 
 
-def _cache_analysis(repo_url: str, result: dict[str, Any]) -> None:
-    """Cache analysis result."""
-    _cache[repo_url] = (result, time.time())
-    logger.debug("Cached analysis for %s", repo_url)
+_token_scope = _auth_scope()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Cache
+# ─────────────────────────────────────────────────────────────────────────────
+# Bounded LRU + TTL: expired entries are evicted by the cache itself and
+# memory stays capped on long-running servers.
+_cache: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+
+# Optional second tier on disk (diskcache): survives restarts and is
+# shared by every worker process pointed at the same GITHUB_CACHE_DIR.
+_disk = (
+    diskcache.FanoutCache(DISK_CACHE_DIR, size_limit=DISK_CACHE_SIZE)
+    if diskcache is not None and DISK_CACHE_DIR
+    else None
+)
+
+
+def _disk_get(repo_url: str) -> dict[str, Any] | None:
+    """Look up a persisted analysis; disk errors count as a miss."""
+    if _disk is None:
+        return None
+    try:
+        return _disk.get(f"{_token_scope}:{repo_url}")
+    except Exception as e:
+        logger.debug("Disk cache read failed for %s: %s", repo_url, e)
+        return None
+
+
+def _disk_set(repo_url: str, result: dict[str, Any]) -> None:
+    """Persist an analysis for DISK_CACHE_TTL; failures are non-fatal."""
+    if _disk is None:
+        return
+    try:
+        _disk.set(f"{_token_scope}:{repo_url}", result, expire=DISK_CACHE_TTL)
+    except Exception as e:
+        logger.debug("Disk cache write failed for %s: %s", repo_url, e)
+
+
+# Conditional GET: last ETag and body per URL. Once the analysis TTL
+# expires, unchanged resources come back as 304 Not Modified, which
+# carries no body and does not count against GitHub's rate limit.
+_etag_cache: LRUCache[str, tuple[str, bytes]] = LRUCache(
+    maxsize=ETAG_CACHE_BYTES, getsizeof=lambda entry: len(entry[1]) or 1
+)
+
+# Single-flight: concurrent cache misses for the same repo await one
+# shared fetch instead of each spending GitHub rate-limit budget.
+_inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -92,19 +262,129 @@ def _parse_repo_url(url: str) -> tuple[str, str]:
     if url.endswith(".git"):
         url = url[:-4]
 
-    match = re.search(r"(?:github\.com/)?([^/]+)/([^/]+)$", url)
+    # Fast path: plain owner/repo segments need no regex search
+    parts = url.rsplit("/", 2)
+    if len(parts) >= 2 and _SEGMENT_RE.fullmatch(parts[-2]) and _SEGMENT_RE.fullmatch(parts[-1]):
+        return parts[-2], parts[-1]
+
+    match = _REPO_RE.search(url)
     if not match:
         raise ValueError(f"Cannot parse GitHub repo from: {url}")
     return match.group(1), match.group(2)
 
 
-def _headers() -> dict[str, str]:
-    """Build request headers, optionally with auth token."""
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    token = os.environ.get("GITHUB_TOKEN")
-    if token:
-        headers["Authorization"] = f"token {token}"
-    return headers
+class RateLimiter:
+    """Throttles GitHub calls using the rate-limit headers of past responses."""
+
+    def __init__(self) -> None:
+        self.remaining: int | None = None
+        self.reset_at: float = 0.0
+
+    def update(self, headers: httpx.Headers) -> None:
+        """Record X-RateLimit-Remaining / X-RateLimit-Reset from a response."""
+        try:
+            if "X-RateLimit-Remaining" in headers:
+                self.remaining = int(headers["X-RateLimit-Remaining"])
+            if "X-RateLimit-Reset" in headers:
+                self.reset_at = float(headers["X-RateLimit-Reset"])
+        except ValueError:
+            pass
+
+    async def wait(self) -> None:
+        """Sleep until the window resets if the remaining budget is nearly spent."""
+        if self.remaining is None or self.remaining >= RATE_LIMIT_MIN_REMAINING:
+            return
+        delay = self.reset_at - time.time()
+        if 0 < delay <= MAX_RATE_LIMIT_WAIT:
+            logger.warning("GitHub rate limit nearly exhausted — waiting %.1fs for reset", delay)
+            await asyncio.sleep(delay)
+            self.remaining = None
+
+
+_rate_limiter = RateLimiter()
+
+
+def _retry_after(resp: httpx.Response) -> float | None:
+    """Seconds to wait from a 403/429 Retry-After header, if honourable."""
+    if resp.status_code not in (403, 429):
+        return None
+    try:
+        delay = float(resp.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+    return delay if 0 <= delay <= MAX_RATE_LIMIT_WAIT else None
+
+
+def _revalidate(url: str, resp: httpx.Response) -> httpx.Response:
+    """Remember ETag'd 200 bodies and replay them for 304 responses."""
+    if resp.status_code == 304:
+        cached = _etag_cache.get(url)
+        if cached is not None:
+            logger.debug("Not modified: %s", url)
+            return httpx.Response(200, content=cached[1], request=resp.request)
+    elif resp.status_code == 200:
+        etag = resp.headers.get("ETag")
+        if etag and len(resp.content) <= ETAG_CACHE_BYTES:
+            _etag_cache[url] = (etag, resp.content)
+    return resp
+
+
+async def _get(url: str) -> httpx.Response | None:
+    """GET a GitHub API URL; returns None on network failure.
+
+    Revalidates previously seen URLs with If-None-Match, waits out a
+    nearly exhausted rate-limit window and retries once when GitHub
+    answers 403/429 with a Retry-After header.
+    """
+    cached = _etag_cache.get(url)
+    headers = {"If-None-Match": cached[0]} if cached else None
+    try:
+        async with _loop_state()[1]:
+            await _rate_limiter.wait()
+            resp = await _send_get(url, headers)
+            _rate_limiter.update(resp.headers)
+
+            delay = _retry_after(resp)
+            if delay is not None:
+                logger.warning("GitHub asked to retry %s after %.1fs", url, delay)
+                await asyncio.sleep(delay)
+                resp = await _send_get(url, headers)
+                _rate_limiter.update(resp.headers)
+            return _revalidate(url, resp)
+    except (httpx.TimeoutException, httpx.NetworkError) as e:
+        logger.warning("Network error for %s: %s", url, e)
+        return None
+    except Exception as e:
+        logger.warning("Request failed for %s: %s", url, e)
+        return None
+
+
+def _days_since(iso_str: str | None, default: int) -> int:
+    """Whole days elapsed since a GitHub ISO-8601 timestamp.
+
+    datetime.fromisoformat parses the trailing "Z" natively on 3.11+.
+    """
+    if not iso_str:
+        return default
+    try:
+        return (datetime.now(timezone.utc) - datetime.fromisoformat(iso_str)).days
+    except (ValueError, TypeError):
+        return default
+
+
+def _project_tree(entries: list[dict[str, Any]]) -> tuple[list[str], int]:
+    """Reduce raw tree entries to lowercase paths plus the blob count.
+
+    Only `path` and `type` feed the signals, so the per-entry dicts
+    (sha, mode, size, url) are dropped as soon as the tree is parsed.
+    """
+    paths: list[str] = []
+    blob_count = 0
+    for entry in entries:
+        paths.append(entry.get("path", "").lower())
+        if entry.get("type") == "blob":
+            blob_count += 1
+    return paths, blob_count
 
 
 def _normalize(value: float, low: float, high: float) -> float:
@@ -122,6 +402,17 @@ class GitHubAnalyzer:
 
     def __init__(self) -> None:
         self.weights = GitHubWeights()
+        # Signal -> overall-score weight, built once rather than per analysis
+        self._weight_map: dict[str, float] = {
+            "commit_activity": self.weights.COMMIT_ACTIVITY,
+            "code_volume": self.weights.CODE_VOLUME,
+            "language_diversity": self.weights.LANGUAGE_DIVERSITY,
+            "community_signals": self.weights.COMMUNITY_SIGNALS,
+            "documentation": self.weights.DOCUMENTATION,
+            "recency": self.weights.RECENCY,
+            "repo_maturity": self.weights.REPO_MATURITY,
+            "code_quality_signals": self.weights.CODE_QUALITY_SIGNALS,
+        }
 
     async def analyze(self, repo_url: str) -> dict[str, Any]:
         """Full analysis pipeline for a GitHub repo.
@@ -135,39 +426,42 @@ class GitHubAnalyzer:
         start_time = time.time()
         
         # Check cache first
-        cached = _get_cached_analysis(repo_url)
+        cached = _cache.get(repo_url)
         if cached:
             duration = time.time() - start_time
             logger.info("[PERF] github_analyzer (cached): %.2fs", duration)
             return cached
-        
+
+        cached = _disk_get(repo_url)
+        if cached:
+            _cache[repo_url] = cached
+            duration = time.time() - start_time
+            logger.info("[PERF] github_analyzer (disk cached): %.2fs", duration)
+            return cached
+
+        task = _inflight.get(repo_url)
+        if task is None:
+            task = asyncio.ensure_future(self._analyze(repo_url))
+            _inflight[repo_url] = task
+            task.add_done_callback(lambda _: _inflight.pop(repo_url, None))
+        else:
+            logger.debug("Joining in-flight analysis for %s", repo_url)
+
+        # shield: a cancelled caller must not cancel the shared fetch
+        result = await asyncio.shield(task)
+
+        duration = time.time() - start_time
+        logger.info("[PERF] github_analyzer (async): %.2fs", duration)
+
+        return result
+
+    async def _analyze(self, repo_url: str) -> dict[str, Any]:
+        """Fetch, score and cache a repo (cache miss path of analyze)."""
         owner, repo = _parse_repo_url(repo_url)
-        headers = _headers()
-
-        # Use requests (sync) in threadpool — httpx async fails on Windows
-        import requests as _req
-        from concurrent.futures import ThreadPoolExecutor
-
-        # trust_env=False bypasses Windows proxy autodiscovery (registry)
-        # which causes ConnectTimeout even when the network works fine
-        _session = _req.Session()
-        _session.trust_env = False
-        _session.headers.update(headers)
-
-        def _get(url):
-            try:
-                r = _session.get(url, timeout=15)
-                return r
-            except (_req.exceptions.ConnectTimeout, _req.exceptions.ReadTimeout, _req.exceptions.ConnectionError) as e:
-                logger.warning("Network error for %s: %s", url, e)
-                return None
-            except Exception as e:
-                logger.warning("Request failed for %s: %s", url, e)
-                return None
 
         # 1. Fetch Repo Metadata First (needed for default branch)
         try:
-            repo_resp = await asyncio.to_thread(_get, f"{GITHUB_API}/repos/{owner}/{repo}")
+            repo_resp = await _get(f"{GITHUB_API}/repos/{owner}/{repo}")
             if repo_resp is None:
                 return self._error_result("Failed to connect to GitHub API")
             if repo_resp.status_code == 404:
@@ -175,54 +469,106 @@ class GitHubAnalyzer:
             if repo_resp.status_code == 403:
                 return self._error_result("GitHub API rate limit exceeded")
             repo_resp.raise_for_status()
-            repo_data = repo_resp.json()
+            repo_data = orjson.loads(repo_resp.content)
         except Exception as e:
             logger.error("GitHub API error: %s", e)
             return self._error_result(f"Failed to fetch repo: {e}")
 
         default_branch = repo_data.get('default_branch', 'main')
 
-        # 2. Parallel Fetch for Remaining Data using ThreadPoolExecutor
+        # 2. Parallel Fetch for Remaining Data (multiplexed on one connection)
         lang_url = f"{GITHUB_API}/repos/{owner}/{repo}/languages"
         contrib_url = f"{GITHUB_API}/repos/{owner}/{repo}/contributors?per_page=30"
         commits_url = f"{GITHUB_API}/repos/{owner}/{repo}/commits?per_page=30"
-        tree_url = f"{GITHUB_API}/repos/{owner}/{repo}/git/trees/{default_branch}"
-
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor(max_workers=4) as pool:
-            futures = [
-                loop.run_in_executor(pool, _get, lang_url),
-                loop.run_in_executor(pool, _get, contrib_url),
-                loop.run_in_executor(pool, _get, commits_url),
-                loop.run_in_executor(pool, _get, tree_url),
-            ]
-            results = await asyncio.gather(*futures, return_exceptions=True)
-        
-        lang_res, contrib_res, commits_res, tree_res = results
+        tree_url = f"{GITHUB_API}/repos/{owner}/{repo}/git/trees/{default_branch}?recursive=1"
 
-        languages = lang_res.json() if lang_res and not isinstance(lang_res, Exception) and lang_res.status_code == 200 else {}
-        contributors = contrib_res.json() if contrib_res and not isinstance(contrib_res, Exception) and contrib_res.status_code == 200 else []
-        commits = commits_res.json() if commits_res and not isinstance(commits_res, Exception) and commits_res.status_code == 200 else []
-        
-        # Tree fetch might fail if branch/sha invalid or too large
-        tree = []
-        if tree_res and not isinstance(tree_res, Exception) and tree_res.status_code == 200:
-            tree = tree_res.json().get("tree", [])
+        pending = asyncio.gather(
+            _get(lang_url),
+            _get(contrib_url),
+            _get(commits_url),
+            _get(tree_url),
+        )
+        # Let the requests go out, then build the signals that only need
+        # repo_data while the slower endpoints (usually the tree) are in flight
+        await asyncio.sleep(0)
 
-        # Build signals
-        signals: list[VerificationSignal] = []
         metadata: dict[str, Any] = {
             "owner": owner,
             "repo": repo,
-            "full_name": repo_data.get("full_name", ""),
-            "description": repo_data.get("description", ""),
-            "default_branch": default_branch,
-            "created_at": repo_data.get("created_at", ""),
-            "updated_at": repo_data.get("updated_at", ""),
-            "pushed_at": repo_data.get("pushed_at", ""),
-            "html_url": repo_data.get("html_url", ""),
-            "topics": repo_data.get("topics", []),
+            **_META_DEFAULTS,
+            **{k: repo_data[k] for k in _META_KEYS if k in repo_data},
         }
+        metadata.setdefault("topics", [])
+
+        # 4. Community Signals
+        stars = repo_data.get("stargazers_count", 0)
+        forks = repo_data.get("forks_count", 0)
+        watchers = repo_data.get("watchers_count", 0)
+        community_raw = (
+            _normalize(stars, 0, self.weights.STARS_HIGH) * 0.50
+            + _normalize(forks, 0, self.weights.FORKS_HIGH) * 0.30
+            + _normalize(watchers, 0, 50) * 0.20
+        )
+        community_signal = VerificationSignal(
+            signal_name="community_signals",
+            value=stars + forks,
+            max_value=self.weights.STARS_HIGH + self.weights.FORKS_HIGH,
+            normalized=min(1.0, community_raw),
+            detail=f"⭐ {stars} stars, 🍴 {forks} forks, 👀 {watchers} watchers",
+        )
+
+        # 6. Recency
+        days_since_push = _days_since(repo_data.get("pushed_at", ""), default=999)
+
+        recency_score = _RECENCY_SCORES[bisect.bisect_left(_RECENCY_THRESHOLDS, days_since_push)]
+
+        recency_signal = VerificationSignal(
+            signal_name="recency",
+            value=days_since_push,
+            max_value=365,
+            normalized=recency_score,
+            detail=f"Last pushed {days_since_push} day(s) ago",
+        )
+
+        # 7. Repo Maturity
+        repo_age_days = _days_since(repo_data.get("created_at", ""), default=0)
+
+        maturity_score = _normalize(
+            repo_age_days, 0, self.weights.MATURITY_ESTABLISHED
+        )
+        maturity_signal = VerificationSignal(
+            signal_name="repo_maturity",
+            value=repo_age_days,
+            max_value=self.weights.MATURITY_ESTABLISHED,
+            normalized=maturity_score,
+            detail=f"Repository age: {repo_age_days} days",
+        )
+
+        lang_res, contrib_res, commits_res, tree_res = await pending
+
+        languages = orjson.loads(lang_res.content) if lang_res is not None and lang_res.status_code == 200 else {}
+        contributors = orjson.loads(contrib_res.content) if contrib_res is not None and contrib_res.status_code == 200 else []
+        commits = orjson.loads(commits_res.content) if commits_res is not None and commits_res.status_code == 200 else []
+        # Languages by byte count, largest first (stable, so ties keep API order)
+        lang_items = sorted(languages.items(), key=itemgetter(1), reverse=True)
+
+        # Tree fetch might fail if branch/sha invalid or too large
+        tree_paths: list[str] = []
+        file_count = 0
+        if tree_res is not None and tree_res.status_code == 200:
+            tree_data = orjson.loads(tree_res.content)
+            tree_paths, file_count = _project_tree(tree_data.get("tree", []))
+            if tree_data.get("truncated", False):
+                # Very large repos exceed GitHub's recursive limit; score
+                # the partial tree rather than walking it directory by directory
+                logger.warning(
+                    "Tree for %s/%s truncated at %d entries — using partial tree",
+                    owner, repo, len(tree_paths),
+                )
+            del tree_data
+
+        # Build signals
+        signals: list[VerificationSignal] = []
 
         # 1. Commit Activity
         total_commits = sum(
@@ -240,15 +586,42 @@ class GitHubAnalyzer:
             detail=f"{total_commits} total contributions across {len(contributors) if isinstance(contributors, list) else 0} contributors",
         ))
 
+        # Single pass over the tree collects every file-based signal
+        tree_names: set[str] = set()
+        doc_hits: set[str] = set()
+        config_hits: set[str] = set()
+        ci_present = test_present = False
+        has_license = has_gitignore = has_readme = False
+        for name in tree_paths:
+            # Recursive trees carry full paths; rules match either the
+            # full path (".github/workflows") or the basename ("readme.md")
+            base = name.rpartition("/")[2]
+            tree_names.add(name)
+            if base in DOC_FILES or name in DOC_FILES:
+                doc_hits.add(base)
+            if base in CONFIG_FILES or name in CONFIG_FILES:
+                config_hits.add(base)
+            if name in CI_FILES or base in CI_FILES:
+                ci_present = True
+            if base in TEST_DIRS:
+                test_present = True
+            if base == "license" or base == "license.md":
+                has_license = True
+            elif base == ".gitignore":
+                has_gitignore = True
+            if base.startswith("readme"):
+                has_readme = True
+        doc_present = len(doc_hits)
+        config_present = len(config_hits)
+
         # 2. Code Volume (file count in tree)
-        file_count = len([t for t in tree if t.get("type") == "blob"])
         vol_score = _normalize(file_count, 0, self.weights.FILE_COUNT_HIGH)
         signals.append(VerificationSignal(
             signal_name="code_volume",
             value=file_count,
             max_value=self.weights.FILE_COUNT_HIGH,
             normalized=vol_score,
-            detail=f"{file_count} files in root tree",
+            detail=f"{file_count} files in repository tree",
         ))
 
         # 3. Language Diversity
@@ -259,33 +632,13 @@ class GitHubAnalyzer:
             value=lang_count,
             max_value=6,
             normalized=lang_score,
-            detail=f"Languages: {', '.join(list(languages.keys())[:5]) if languages else 'none detected'}",
+            detail=f"Languages: {', '.join(name for name, _ in lang_items[:5]) if lang_items else 'none detected'}",
         ))
 
-        # 4. Community Signals
-        stars = repo_data.get("stargazers_count", 0)
-        forks = repo_data.get("forks_count", 0)
-        watchers = repo_data.get("watchers_count", 0)
-        community_raw = (
-            _normalize(stars, 0, self.weights.STARS_HIGH) * 0.50
-            + _normalize(forks, 0, self.weights.FORKS_HIGH) * 0.30
-            + _normalize(watchers, 0, 50) * 0.20
-        )
-        signals.append(VerificationSignal(
-            signal_name="community_signals",
-            value=stars + forks,
-            max_value=self.weights.STARS_HIGH + self.weights.FORKS_HIGH,
-            normalized=min(1.0, community_raw),
-            detail=f"⭐ {stars} stars, 🍴 {forks} forks, 👀 {watchers} watchers",
-        ))
+        # 4. Community Signals (built while fetching)
+        signals.append(community_signal)
 
         # 5. Documentation
-        tree_names = {t.get("path", "").lower() for t in tree}
-        doc_present = sum(1 for d in DOC_FILES if d in tree_names)
-        ci_present = any(c in tree_names for c in CI_FILES)
-        config_present = sum(1 for c in CONFIG_FILES if c in tree_names)
-        test_present = any(t in tree_names for t in TEST_DIRS)
-
         doc_signals_count = doc_present + (2 if ci_present else 0) + min(config_present, 3) + (2 if test_present else 0)
         doc_score = _normalize(doc_signals_count, 0, 10)
         signals.append(VerificationSignal(
@@ -296,61 +649,12 @@ class GitHubAnalyzer:
             detail=f"Docs: {doc_present}, CI: {ci_present}, Config: {config_present}, Tests: {test_present}",
         ))
 
-        # 6. Recency
-        pushed_at = repo_data.get("pushed_at", "")
-        days_since_push = 999
-        if pushed_at:
-            try:
-                push_dt = datetime.fromisoformat(pushed_at.replace("Z", "+00:00"))
-                days_since_push = (datetime.now(timezone.utc) - push_dt).days
-            except (ValueError, TypeError):
-                pass
-
-        if days_since_push <= self.weights.RECENCY_EXCELLENT:
-            recency_score = 1.0
-        elif days_since_push <= self.weights.RECENCY_GOOD:
-            recency_score = 0.7
-        elif days_since_push <= self.weights.RECENCY_ACCEPTABLE:
-            recency_score = 0.4
-        else:
-            recency_score = 0.1
-
-        signals.append(VerificationSignal(
-            signal_name="recency",
-            value=days_since_push,
-            max_value=365,
-            normalized=recency_score,
-            detail=f"Last pushed {days_since_push} day(s) ago",
-        ))
-
-        # 7. Repo Maturity
-        created_at = repo_data.get("created_at", "")
-        repo_age_days = 0
-        if created_at:
-            try:
-                create_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                repo_age_days = (datetime.now(timezone.utc) - create_dt).days
-            except (ValueError, TypeError):
-                pass
-
-        maturity_score = _normalize(
-            repo_age_days, 0, self.weights.MATURITY_ESTABLISHED
-        )
-        signals.append(VerificationSignal(
-            signal_name="repo_maturity",
-            value=repo_age_days,
-            max_value=self.weights.MATURITY_ESTABLISHED,
-            normalized=maturity_score,
-            detail=f"Repository age: {repo_age_days} days",
-        ))
+        # 6–7. Recency and Repo Maturity (built while fetching)
+        signals.append(recency_signal)
+        signals.append(maturity_signal)
 
         # 8. Code Quality Signals (heuristic)
-        has_license = "license" in tree_names or "license.md" in tree_names
-        has_gitignore = ".gitignore" in tree_names
-        has_readme = any(
-            n.startswith("readme") for n in tree_names
-        )
-        quality_bits = sum([has_license, has_gitignore, has_readme, ci_present, test_present])
+        quality_bits = has_license + has_gitignore + has_readme + ci_present + test_present
         quality_score = _normalize(quality_bits, 0, 5)
         signals.append(VerificationSignal(
             signal_name="code_quality_signals",
@@ -361,32 +665,18 @@ class GitHubAnalyzer:
         ))
 
         # ── Compute weighted overall score ────────────────────────────
-        weight_map = {
-            "commit_activity": self.weights.COMMIT_ACTIVITY,
-            "code_volume": self.weights.CODE_VOLUME,
-            "language_diversity": self.weights.LANGUAGE_DIVERSITY,
-            "community_signals": self.weights.COMMUNITY_SIGNALS,
-            "documentation": self.weights.DOCUMENTATION,
-            "recency": self.weights.RECENCY,
-            "repo_maturity": self.weights.REPO_MATURITY,
-            "code_quality_signals": self.weights.CODE_QUALITY_SIGNALS,
-        }
-
+        weight_map = self._weight_map
         overall = sum(
             s.normalized * weight_map.get(s.signal_name, 0)
             for s in signals
         )
         
         # Calculate level/explanation for frontend
-        credibility = "Minimal"
-        if overall >= 0.9: credibility = "Exceptional"
-        elif overall >= 0.7: credibility = "Strong"
-        elif overall >= 0.5: credibility = "Moderate"
-        elif overall >= 0.3: credibility = "Developing"
+        credibility = _CREDIBILITY_LABELS[bisect.bisect_right(_CREDIBILITY_THRESHOLDS, overall)]
         
         # Build explanation text for the UI
         explanation = (
-            f"Credibility: {credibility} ({(overall * 100):.0f}/100) in {max(languages, key=languages.get) if languages else 'detected languages'}. "
+            f"Credibility: {credibility} ({(overall * 100):.0f}/100) in {lang_items[0][0] if lang_items else 'detected languages'}. "
             f"Strengths: {signals[0].detail}; "
             f"{signals[3].detail}. "
             f"Areas for improvement: {next((s.signal_name.replace('_', ' ') for s in signals if s.normalized < 0.5), 'None')}."
@@ -413,11 +703,9 @@ class GitHubAnalyzer:
             "overall_score": round(overall, 4),
         }
         
-        _cache_analysis(repo_url, result)
-        
-        duration = time.time() - start_time
-        logger.info("[PERF] github_analyzer (async): %.2fs", duration)
-        
+        _cache[repo_url] = result
+        _disk_set(repo_url, result)
+
         return result
 
     def _detect_domains(
@@ -439,9 +727,16 @@ class GitHubAnalyzer:
                 domains[domain] = max(domains.get(domain, 0), confidence)
 
         # Subdomain detection from tree names + topics
-        all_names = tree_names | {t.lower() for t in topics}
-        for subdomain, keywords in SUBDOMAIN_SIGNALS.items():
-            matches = sum(1 for kw in keywords if any(kw in n for n in all_names))
+        # Keywords never contain "\n", so a substring hit in the joined
+        # haystack is a hit in some individual name.
+        haystack = "\n".join(tree_names | {t.lower() for t in topics})
+        match_counts = dict.fromkeys(SUBDOMAIN_SIGNALS, 0)
+        for kw, subdomains in _KEYWORD_SUBDOMAINS.items():
+            if kw in haystack:
+                for subdomain in subdomains:
+                    match_counts[subdomain] += 1
+
+        for subdomain, matches in match_counts.items():
             if matches >= 2:
                 confidence = min(1.0, matches / 4)
                 domains[subdomain] = max(domains.get(subdomain, 0), confidence)
@@ -149,7 +149,7 @@ class ProjectWeights:
 # ─────────────────────────────────────────────────────────────────────────────
 # Documentation Signals
 # ─────────────────────────────────────────────────────────────────────────────
-DOC_FILES = {
+DOC_FILES: frozenset[str] = frozenset({
     "readme.md", "readme.rst", "readme.txt", "readme",
     "contributing.md", "contributing.rst",
     "changelog.md", "changelog.rst", "changes.md",
@@ -157,18 +157,18 @@ DOC_FILES = {
     "code_of_conduct.md",
     "security.md",
     "docs",
-}
+})
 
-CI_FILES = {
+CI_FILES: frozenset[str] = frozenset({
     ".github/workflows",
     ".gitlab-ci.yml",
     ".travis.yml",
     "jenkinsfile",
     ".circleci",
     "azure-pipelines.yml",
-}
+})
 
-CONFIG_FILES = {
+CONFIG_FILES: frozenset[str] = frozenset({
     "pyproject.toml", "setup.py", "setup.cfg",
     "package.json", "tsconfig.json",
     "cargo.toml",
@@ -178,12 +178,12 @@ CONFIG_FILES = {
     "makefile", "cmake",
     "docker-compose.yml", "dockerfile",
     ".env.example", ".editorconfig",
-}
+})
 
-TEST_DIRS = {
+TEST_DIRS: frozenset[str] = frozenset({
     "tests", "test", "spec", "specs",
     "__tests__", "e2e", "integration_tests",
-}
+})
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -7,7 +7,7 @@ and ARC-4 decoding utilities.
 """
 
 from backend.core.algorand_client import AlgorandClientManager, AlgorandError
-from backend.core.arc4_decoder import ARC4Decoder
+from backend.core.arc4_decoder import ARC4Decoder, SkillRecord
 from backend.core.contract_service import ContractService, SubmissionResult
 
 __all__ = [
@@ -15,5 +15,6 @@ __all__ = [
     "AlgorandError",
     "ARC4Decoder",
     "ContractService",
+    "SkillRecord",
     "SubmissionResult",
 ]
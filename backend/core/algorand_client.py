@@ -3,7 +3,7 @@ Algorand Client Manager — Production Infrastructure
 =====================================================
 
 Centralized Algorand client initialization with:
-    • Exponential backoff retry logic
+    • Exponential backoff retry logic (full jitter)
     • Structured exception handling
     • Transaction confirmation waiting
     • Connection pooling
@@ -12,13 +12,23 @@ Centralized Algorand client initialization with:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+import re
+import threading
 import time
+from functools import cache, cached_property
 from pathlib import Path
 from typing import Any, Callable
+from urllib import parse
 
 import algokit_utils
+import httpx
 from algokit_utils.models.transaction import SendParams
+from algosdk import constants
+from algosdk.error import AlgodHTTPError, AlgodResponseError
+from algosdk.v2client.algod import AlgodClient, api_version_path_prefix
 from dotenv import load_dotenv
 
 logger = logging.getLogger("backend.core.algorand")
@@ -58,8 +68,27 @@ def _agent_log(*, hypothesisId: str, runId: str, location: str, message: str, da
 MAX_RETRIES = 3
 BASE_RETRY_DELAY = 2.0
 MAX_RETRY_DELAY = 16.0
-DEFAULT_VALIDITY_WINDOW = 1000
+CONFIRMATION_WAIT_ROUNDS = 3  # instant finality: confirmed = in a block
+# Transactions expire within the confirmation wait, so a send reported as
+# timed out can never land later (and a client retry cannot duplicate it)
+DEFAULT_VALIDITY_WINDOW = CONFIRMATION_WAIT_ROUNDS
 DEFAULT_TIMEOUT = 30.0
+ALGOD_POOL_SIZE = 20
+MAX_RETRY_AFTER = 60.0
+
+# Error classifiers — one case-insensitive scan each, no lowered copy
+_RATE_LIMIT_RE = re.compile(r"rate limit|429", re.IGNORECASE)
+_RETRIABLE_RE = re.compile(
+    r"txn dead|round outside|transaction expired|stale|pool error", re.IGNORECASE
+)
+_NETWORK_RE = re.compile(r"connection|timeout", re.IGNORECASE)
+_NETWORK_ERRORS = (ConnectionError, TimeoutError, httpx.TransportError)
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 # Public TestNet Defaults (AlgoNode)
 TESTNET_ALGOD_SERVER = "https://testnet-api.algonode.cloud"
@@ -70,6 +99,60 @@ TESTNET_INDEXER_PORT = 443
 TESTNET_INDEXER_TOKEN = ""
 
 
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter backoff: uniform over [0, min(cap, base * 2**(attempt-1))]."""
+    return random.uniform(0, min(MAX_RETRY_DELAY, BASE_RETRY_DELAY * (2 ** (attempt - 1))))
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    """Seconds from a server Retry-After header carried by ``exc``, if honourable.
+
+    algosdk raises ``AlgodHTTPError`` from inside its urllib ``HTTPError``
+    handler, so the headers live on the chained context; httpx/requests style
+    errors expose them on ``exc.response``.
+    """
+    seen: BaseException | None = exc
+    while seen is not None:
+        headers = getattr(getattr(seen, "response", None), "headers", None)
+        if headers is None:
+            headers = getattr(seen, "headers", None)
+        if headers is not None:
+            try:
+                delay = float(headers.get("Retry-After"))
+            except (TypeError, ValueError):
+                delay = None
+            if delay is not None:
+                return delay if 0 <= delay <= MAX_RETRY_AFTER else None
+        seen = seen.__cause__ or seen.__context__
+    return None
+
+
+def _classify_error(exc: BaseException, error_msg: str | None = None) -> str:
+    """Classify ``exc`` as "rate_limit", "retriable", "network" or "fatal".
+
+    Structured signals (HTTP status, exception type) are checked first; the
+    message (``error_msg`` if already rendered) is only scanned for exception
+    types that carry neither.
+    """
+    code = getattr(exc, "code", None) or getattr(
+        getattr(exc, "response", None), "status_code", None
+    )
+    if code == 429:
+        return "rate_limit"
+    if isinstance(exc, _NETWORK_ERRORS):
+        return "network"
+
+    if error_msg is None:
+        error_msg = str(exc)
+    if _RATE_LIMIT_RE.search(error_msg):
+        return "rate_limit"
+    if _RETRIABLE_RE.search(error_msg):
+        return "retriable"
+    if _NETWORK_RE.search(error_msg):
+        return "network"
+    return "fatal"
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Exceptions
 # ─────────────────────────────────────────────────────────────────────────────
@@ -93,6 +176,93 @@ class NetworkError(AlgorandError):
     pass
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Pooled algod transport
+# ─────────────────────────────────────────────────────────────────────────────
+class _PooledAlgodClient(AlgodClient):
+    """AlgodClient that keeps connections alive across calls.
+
+    algosdk opens a fresh ``urlopen`` connection (TCP + TLS handshake) per
+    request, which dominates retry and confirmation loops. This routes the
+    same requests through one pooled ``httpx.Client``; retries stay ours.
+    """
+
+    def __init__(self, algod_token: str, algod_address: str, headers: dict[str, str] | None = None) -> None:
+        super().__init__(algod_token, algod_address, headers)
+        self._session: httpx.Client | None = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> httpx.Client:
+        """Pooled HTTP client, opened on first use and again after ``close()``."""
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                session = self._session
+                if session is None:
+                    session = self._session = httpx.Client(
+                        http2=_HTTP2,
+                        follow_redirects=True,
+                        limits=httpx.Limits(
+                            max_connections=ALGOD_POOL_SIZE, max_keepalive_connections=ALGOD_POOL_SIZE
+                        ),
+                    )
+        return session
+
+    def close(self) -> None:
+        """Close the pooled connections; a later request opens a new pool."""
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: Any = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+        timeout: int | None = 30,
+    ) -> Any:
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+
+        resp = self.session.request(
+            method, self.algod_address + requrl, content=data, headers=header, timeout=timeout
+        )
+
+        if resp.is_error:
+            try:
+                body = resp.json()
+                message = body["message"]
+            except Exception:
+                body, message = {}, resp.text
+            err = AlgodHTTPError(message, resp.status_code, body.get("data"))
+            err.response = resp  # exposes Retry-After to the retry loop
+            raise err
+
+        if response_format == "json":
+            if not resp.content:
+                return {}
+            try:
+                return resp.json()
+            except Exception as exc:
+                raise AlgodResponseError("Failed to parse JSON response from algod") from exc
+        return resp.content
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Client Manager
 # ─────────────────────────────────────────────────────────────────────────────
@@ -107,20 +277,25 @@ class AlgorandClientManager:
         env_path : Path, optional
             Path to .env file. If None, searches parent directories.
         """
-        if env_path:
-            load_dotenv(env_path)
-        else:
-            load_dotenv()
+        load_env(env_path)
 
         self._client: algokit_utils.AlgorandClient | None = None
         self._deployer_address: str | None = None
+        self._http: httpx.AsyncClient | None = None
         self._initialized = False
+        self._init_lock = threading.Lock()
 
     def initialize(self) -> None:
         """Initialize Algorand client and deployer account."""
+        # Double-checked: the lock is only taken until the first init lands
         if self._initialized:
             return
+        with self._init_lock:
+            if not self._initialized:
+                self._initialize()
 
+    def _initialize(self) -> None:
+        """Build the client and resolve the deployer (caller holds the lock)."""
         import os
         # region agent log
         _agent_log(
@@ -149,7 +324,23 @@ class AlgorandClientManager:
             os.environ["INDEXER_TOKEN"] = TESTNET_INDEXER_TOKEN
 
         try:
-            self._client = algokit_utils.AlgorandClient.from_environment()
+            config = algokit_utils.ClientManager.get_config_from_environment_or_localnet()
+            algod_config = config.algod_config
+            self._client = algokit_utils.AlgorandClient.from_clients(
+                algod=_PooledAlgodClient(
+                    algod_config.token or "",
+                    algod_config.full_url(),
+                    headers={"X-Algo-API-Token": algod_config.token or ""},
+                ),
+                indexer=(
+                    algokit_utils.ClientManager.get_indexer_client(config.indexer_config)
+                    if config.indexer_config else None
+                ),
+                kmd=(
+                    algokit_utils.ClientManager.get_kmd_client(config.kmd_config)
+                    if config.kmd_config else None
+                ),
+            )
             self._client.set_default_validity_window(DEFAULT_VALIDITY_WINDOW)
 
             # Some endpoints might fail if no DEPLOYER mnemonic available
@@ -183,18 +374,17 @@ class AlgorandClientManager:
             logger.error("Failed to initialize Algorand client: %s", exc)
             raise AlgorandError(f"Client initialization failed: {exc}") from exc
 
-    @property
+    # Cached: after the first access these are plain instance attribute reads.
+    @cached_property
     def client(self) -> algokit_utils.AlgorandClient:
         """Get initialized Algorand client."""
-        if not self._initialized:
-            self.initialize()
+        self.initialize()
         return self._client  # type: ignore[return-value]
 
-    @property
+    @cached_property
     def deployer_address(self) -> str:
         """Get deployer wallet address."""
-        if not self._initialized:
-            self.initialize()
+        self.initialize()
         return self._deployer_address  # type: ignore[return-value]
 
     def send_and_confirm(
@@ -229,7 +419,6 @@ class AlgorandClientManager:
             If network connectivity fails.
         """
         last_exception: Exception | None = None
-        delay = BASE_RETRY_DELAY
 
         for attempt in range(1, max_retries + 1):
             try:
@@ -243,30 +432,37 @@ class AlgorandClientManager:
 
             except Exception as exc:
                 last_exception = exc
-                error_msg = str(exc).lower()
+                # Render once: algod errors can carry whole request payloads
+                exc_str = str(exc)
+                kind = _classify_error(exc, exc_str)
+                delay = _backoff_delay(attempt)
 
                 # Classify error
-                if "rate limit" in error_msg or "429" in error_msg:
+                if kind == "rate_limit":
                     if attempt >= max_retries:
-                        raise RateLimitError(f"Rate limit exceeded: {exc}") from exc
+                        raise RateLimitError(f"Rate limit exceeded: {exc_str}") from exc
+                    retry_after = _retry_after(exc)
+                    if retry_after is not None:
+                        delay = max(retry_after, delay)
                     logger.warning(
-                        "Rate limit hit on %s (attempt %d/%d) — retrying in %.1fs",
-                        operation_name, attempt, max_retries, delay
+                        "Rate limit hit on %s (attempt %d/%d) — retrying in %.1fs (%s)",
+                        operation_name, attempt, max_retries, delay,
+                        "server Retry-After" if retry_after is not None else "client backoff",
                     )
 
-                elif self._is_retriable(exc):
+                elif kind == "retriable":
                     if attempt >= max_retries:
                         raise TransactionError(
-                            f"{operation_name} failed after {max_retries} attempts: {exc}"
+                            f"{operation_name} failed after {max_retries} attempts: {exc_str}"
                         ) from exc
                     logger.warning(
                         "Retriable error on %s (attempt %d/%d) — retrying in %.1fs: %s",
-                        operation_name, attempt, max_retries, delay, exc
+                        operation_name, attempt, max_retries, delay, exc_str
                     )
 
-                elif "connection" in error_msg or "timeout" in error_msg:
+                elif kind == "network":
                     if attempt >= max_retries:
-                        raise NetworkError(f"Network error: {exc}") from exc
+                        raise NetworkError(f"Network error: {exc_str}") from exc
                     logger.warning(
                         "Network error on %s (attempt %d/%d) — retrying in %.1fs",
                         operation_name, attempt, max_retries, delay
@@ -274,12 +470,11 @@ class AlgorandClientManager:
 
                 else:
                     # Non-retriable error
-                    logger.error("Non-retriable error on %s: %s", operation_name, exc)
-                    raise TransactionError(f"{operation_name} failed: {exc}") from exc
+                    logger.error("Non-retriable error on %s: %s", operation_name, exc_str)
+                    raise TransactionError(f"{operation_name} failed: {exc_str}") from exc
 
-                # Exponential backoff
+                # Exponential backoff with full jitter
                 time.sleep(delay)
-                delay = min(delay * 2, MAX_RETRY_DELAY)
 
         # Should not reach here, but handle gracefully
         raise TransactionError(
@@ -313,7 +508,6 @@ class AlgorandClientManager:
             If transaction submission fails after all retries.
         """
         last_exception: Exception | None = None
-        delay = BASE_RETRY_DELAY
 
         for attempt in range(1, max_retries + 1):
             try:
@@ -322,24 +516,25 @@ class AlgorandClientManager:
                     operation_name, attempt, max_retries
                 )
                 result = txn_callable()
-                tx_id = result.tx_ids[0] if hasattr(result, 'tx_ids') and result.tx_ids else "unknown"
+                tx_ids = getattr(result, "tx_ids", None)
+                tx_id = tx_ids[-1] if tx_ids else "unknown"  # last = primary txn of a group
                 logger.info("✓ %s sent successfully — txid: %s", operation_name, tx_id)
                 return result, tx_id
 
             except Exception as exc:
                 last_exception = exc
-                error_msg = str(exc).lower()
+                error_msg = str(exc)  # rendered once for the check, log and error
 
-                if self._is_retriable(exc) and attempt < max_retries:
+                if self._is_retriable(error_msg) and attempt < max_retries:
+                    delay = _backoff_delay(attempt)
                     logger.warning(
                         "Retriable error on %s (attempt %d/%d) — retrying in %.1fs: %s",
-                        operation_name, attempt, max_retries, delay, exc
+                        operation_name, attempt, max_retries, delay, error_msg
                     )
                     time.sleep(delay)
-                    delay = min(delay * 2, MAX_RETRY_DELAY)
                 else:
-                    logger.error("Transaction send failed on %s: %s", operation_name, exc)
-                    raise TransactionError(f"{operation_name} send failed: {exc}") from exc
+                    logger.error("Transaction send failed on %s: %s", operation_name, error_msg)
+                    raise TransactionError(f"{operation_name} send failed: {error_msg}") from exc
 
         raise TransactionError(
             f"{operation_name} failed after {max_retries} attempts: {last_exception}"
@@ -370,23 +565,157 @@ class AlgorandClientManager:
         TransactionError
             If confirmation times out or fails.
         """
+        return self.wait_many([txid], timeout)[txid]
+
+    def wait_many(
+        self,
+        txids: list[str],
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> dict[str, dict[str, Any]]:
+        """Wait for several transactions to confirm within one shared deadline.
+
+        All pending txids are checked once per round: between checks the
+        call blocks server-side in ``status_after_block`` until the next
+        round closes, so N waits cost one round wait rather than N serial
+        confirmation loops.
+
+        Parameters
+        ----------
+        txids : list[str]
+            Transaction IDs to wait for.
+        timeout : float
+            Maximum wait time in seconds for the whole batch.
+
+        Returns
+        -------
+        dict[str, dict]
+            Confirmed transaction info keyed by txid.
+
+        Raises
+        ------
+        TransactionError
+            If any transaction is unconfirmed at the deadline or polling fails.
+        """
+        pending = list(dict.fromkeys(txids))
+        confirmed: dict[str, dict[str, Any]] = {}
         try:
-            logger.debug("Waiting for confirmation of txid: %s", txid)
+            logger.debug("Waiting for confirmation of %d txid(s)", len(pending))
+            algod = self.client.client.algod
             start = time.time()
+            last_round = algod.status()["last-round"]
+
+            while True:
+                still_pending = []
+                for txid in pending:
+                    result = algod.pending_transaction_info(txid)
+                    if result.get("confirmed-round"):
+                        logger.info(
+                            "✓ Transaction %s confirmed in round %d",
+                            txid, result["confirmed-round"]
+                        )
+                        confirmed[txid] = result
+                    else:
+                        still_pending.append(txid)
+                pending = still_pending
+
+                if not pending:
+                    return confirmed
+                if time.time() - start >= timeout:
+                    break
+                last_round = algod.status_after_block(last_round)["last-round"]
+
+            raise TransactionError(
+                f"Transaction {', '.join(pending)} confirmation timeout after {timeout}s"
+            )
+
+        except Exception as exc:
+            logger.error("Failed to confirm transaction %s: %s", ", ".join(pending), exc)
+            raise TransactionError(f"Confirmation failed: {exc}") from exc
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Get a lazily created async HTTP client pointed at algod."""
+        if self._http is None:
+            algod = self.client.client.algod
+            self._http = httpx.AsyncClient(
+                base_url=algod.algod_address,
+                headers={"X-Algo-API-Token": algod.algod_token, **(algod.headers or {})},
+                timeout=DEFAULT_TIMEOUT,
+            )
+        return self._http
 
-            # Use AlgoKit's built-in confirmation waiting
-            result = self.client.client.algod.pending_transaction_info(txid)
+    async def aclose(self) -> None:
+        """Close the algod HTTP clients that were created.
 
-            while time.time() - start < timeout:
+        Releases both the async client behind ``wait_for_confirmation_async``
+        and the pooled sync transport of the Algorand client; either is
+        reopened on next use.
+        """
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        algod = self._client.client.algod if self._client is not None else None
+        if isinstance(algod, _PooledAlgodClient):
+            algod.close()
+
+    async def _poll_pending(self, txid: str) -> dict[str, Any]:
+        """Fetch pending transaction info for ``txid`` without blocking the loop."""
+        resp = await self.http.get(f"/v2/transactions/pending/{txid}", params={"format": "json"})
+        resp.raise_for_status()
+        return resp.json()
+
+    async def _round_after(self, last_round: int | None) -> int:
+        """Return the latest round, or wait server-side for one after ``last_round``."""
+        path = "/v2/status" if last_round is None else f"/v2/status/wait-for-block-after/{last_round}"
+        resp = await self.http.get(path)
+        resp.raise_for_status()
+        return resp.json()["last-round"]
+
+    async def wait_for_confirmation_async(
+        self,
+        txid: str,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> dict[str, Any]:
+        """Wait for transaction confirmation on the running event loop.
+
+        Parameters
+        ----------
+        txid : str
+            Transaction ID to wait for.
+        timeout : float
+            Maximum wait time in seconds.
+
+        Returns
+        -------
+        dict
+            Confirmed transaction info.
+
+        Raises
+        ------
+        TransactionError
+            If confirmation times out or fails.
+        """
+        try:
+            logger.debug("Waiting for confirmation of txid: %s", txid)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            last_round = await self._round_after(None)
+
+            while True:
+                result = await self._poll_pending(txid)
                 if result.get("confirmed-round"):
                     logger.info(
                         "✓ Transaction %s confirmed in round %d",
                         txid, result["confirmed-round"]
                     )
                     return result
-
-                time.sleep(1)
-                result = self.client.client.algod.pending_transaction_info(txid)
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    last_round = await asyncio.wait_for(self._round_after(last_round), remaining)
+                except asyncio.TimeoutError:
+                    break
 
             raise TransactionError(f"Transaction {txid} confirmation timeout after {timeout}s")
 
@@ -394,17 +723,53 @@ class AlgorandClientManager:
             logger.error("Failed to confirm transaction %s: %s", txid, exc)
             raise TransactionError(f"Confirmation failed: {exc}") from exc
 
+    async def wait_many_async(
+        self,
+        txids: list[str],
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> dict[str, dict[str, Any]]:
+        """Wait for several transactions concurrently.
+
+        Parameters
+        ----------
+        txids : list[str]
+            Transaction IDs to wait for.
+        timeout : float
+            Maximum wait time in seconds for each transaction.
+
+        Returns
+        -------
+        dict[str, dict]
+            Confirmed transaction info keyed by txid.
+
+        Raises
+        ------
+        TransactionError
+            If any confirmation times out or fails.
+        """
+        unique = list(dict.fromkeys(txids))
+        results = await asyncio.gather(
+            *(self.wait_for_confirmation_async(txid, timeout) for txid in unique)
+        )
+        return dict(zip(unique, results))
+
     def create_send_params(
         self,
-        max_rounds_to_wait: int = DEFAULT_VALIDITY_WINDOW,
+        max_rounds_to_wait: int = CONFIRMATION_WAIT_ROUNDS,
         populate_resources: bool = True,
     ) -> SendParams:
         """Create SendParams with standard configuration.
 
+        Confirmation returns as soon as the group lands in a block; the
+        round bound only caps how long a stuck send blocks the caller.
+
         Parameters
         ----------
         max_rounds_to_wait : int
-            Maximum rounds to wait for confirmation.
+            Maximum rounds to wait for confirmation. Keep it non-zero so
+            the composer skips its extra suggested-params fetch, and no
+            shorter than ``DEFAULT_VALIDITY_WINDOW``, so a timeout means
+            the transaction has expired rather than still pending.
         populate_resources : bool
             Whether to auto-populate app call resources.
 
@@ -419,34 +784,46 @@ class AlgorandClientManager:
         )
 
     @staticmethod
-    def _is_retriable(exc: Exception) -> bool:
+    def _is_retriable(exc: Exception | str) -> bool:
         """Check if exception is retriable.
 
         Parameters
         ----------
-        exc : Exception
-            Exception to check.
+        exc : Exception or str
+            Exception to check, or its already-rendered message.
 
         Returns
         -------
         bool
             True if error is transient and retriable.
         """
-        msg = str(exc).lower()
-        retriable_patterns = [
-            "txn dead",
-            "round outside",
-            "transaction expired",
-            "stale",
-            "pool error",
-        ]
-        return any(pattern in msg for pattern in retriable_patterns)
+        return _RETRIABLE_RE.search(exc if isinstance(exc, str) else str(exc)) is not None
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Singleton instance
 # ─────────────────────────────────────────────────────────────────────────────
 _manager: AlgorandClientManager | None = None
+_manager_lock = threading.Lock()
+
+
+def load_env(env_path: Path | None = None) -> None:
+    """Load a .env file into ``os.environ``, parsing each file once per process.
+
+    Parameters
+    ----------
+    env_path : Path, optional
+        Path to .env file. If None, searches parent directories.
+    """
+    _load_env_once(env_path)
+
+
+@cache
+def _load_env_once(env_path: Path | None) -> None:
+    if env_path:
+        load_dotenv(env_path)
+    else:
+        load_dotenv()
 
 
 def get_manager(env_path: Path | None = None) -> AlgorandClientManager:
@@ -463,7 +840,21 @@ def get_manager(env_path: Path | None = None) -> AlgorandClientManager:
         Singleton manager instance.
     """
     global _manager
-    if _manager is None:
-        _manager = AlgorandClientManager(env_path)
-        _manager.initialize()
-    return _manager
+    manager = _manager
+    if manager is None:
+        with _manager_lock:
+            manager = _manager
+            if manager is None:
+                manager = AlgorandClientManager(env_path)
+                manager.initialize()
+                _manager = manager
+    return manager
+
+
+async def close_manager() -> None:
+    """Release the singleton manager's algod connections, if it exists.
+
+    Safe to call on shutdown whether or not the manager was ever built.
+    """
+    if _manager is not None:
+        await _manager.aclose()
@@ -22,37 +22,122 @@ from __future__ import annotations
 
 import logging
 import struct
-from typing import Any
+from array import array
+from typing import Any, Iterator, Literal, NamedTuple, overload
 
 logger = logging.getLogger("backend.core.arc4")
 
+# Precompiled layouts: the 22-byte static header (mode_offset, domain_offset,
+# score, artifact_offset, timestamp) and the 2-byte length prefix.
+_HEADER = struct.Struct(">HHQHQ")
+_U16 = struct.Struct(">H")
+
+# Give up on a box after this many back-to-back undecodable records
+MAX_CONSECUTIVE_FAILURES = 8
+
 
 class ARC4DecodingError(Exception):
     """Raised when ARC-4 decoding fails."""
     pass
 
 
+class SkillRecord(NamedTuple):
+    """Decoded SkillRecord — a compact tuple, field order matches the struct."""
+
+    mode: str
+    domain: str
+    score: int
+    artifact_hash: str
+    timestamp: int
+
+
 class ARC4Decoder:
     """Stateless ARC-4 decoder for SkillRecord structs."""
 
+    _REQUIRED_KEYS = frozenset(SkillRecord._fields)
+
+    # as_dict picks the record shape; error dicts can appear in either
+    @overload
     @staticmethod
-    def decode_skill_records(raw: bytes) -> list[dict[str, Any]]:
-        """Decode length-prefixed ARC-4 SkillRecord structs.
+    def decode_skill_records(
+        raw: bytes, as_dict: Literal[True] = ..., domain_filter: str | None = ...
+    ) -> list[dict[str, Any]]: ...
 
-        Parameters
-        ----------
-        raw : bytes
-            Raw bytes from Algorand Box storage.
+    @overload
+    @staticmethod
+    def decode_skill_records(
+        raw: bytes, as_dict: Literal[False], domain_filter: str | None = ...
+    ) -> list[SkillRecord | dict[str, Any]]: ...
+
+    @overload
+    @staticmethod
+    def decode_skill_records(
+        raw: bytes, as_dict: bool, domain_filter: str | None = ...
+    ) -> list[dict[str, Any]] | list[SkillRecord | dict[str, Any]]: ...
+
+    @staticmethod
+    def decode_skill_records(
+        raw: bytes, as_dict: bool = True, domain_filter: str | None = None
+    ) -> list[dict[str, Any]] | list[SkillRecord | dict[str, Any]]:
+        """Decode length-prefixed ARC-4 SkillRecord structs into a list.
+
+        Collects ``iter_skill_records``; see there for the parameters.
 
         Returns
         -------
-        list[dict]
-            List of decoded records with keys:
+        list[dict] or list[SkillRecord]
+            Every decoded record, in box order.
+        """
+        records = list(ARC4Decoder.iter_skill_records(raw, as_dict, domain_filter))
+        logger.debug("Decoded %d records from %d bytes", len(records), len(raw or b""))
+        return records
+
+    @overload
+    @staticmethod
+    def iter_skill_records(
+        raw: bytes, as_dict: Literal[True] = ..., domain_filter: str | None = ...
+    ) -> Iterator[dict[str, Any]]: ...
+
+    @overload
+    @staticmethod
+    def iter_skill_records(
+        raw: bytes, as_dict: bool, domain_filter: str | None = ...
+    ) -> Iterator[dict[str, Any] | SkillRecord]: ...
+
+    @staticmethod
+    def iter_skill_records(
+        raw: bytes, as_dict: bool = True, domain_filter: str | None = None
+    ) -> Iterator[dict[str, Any] | SkillRecord]:
+        """Decode length-prefixed ARC-4 SkillRecord structs one at a time.
+
+        Records are yielded as they are decoded, so a caller that streams
+        them onward never holds the whole decoded list.
+
+        Parameters
+        ----------
+        raw : bytes-like
+            Raw bytes from Algorand Box storage (bytes, bytearray or
+            memoryview).
+        as_dict : bool
+            Return each record as a dict (default). Pass False to get
+            ``SkillRecord`` tuples instead, which are smaller and skip the
+            per-record dict build for callers that only iterate fields.
+        domain_filter : str, optional
+            Only return records whose domain equals this value. Other
+            records are skipped after reading just their domain string,
+            and undecodable records are dropped instead of reported.
+
+        Yields
+        ------
+        dict or SkillRecord
+            Decoded records with keys:
             - mode: str
             - domain: str
             - score: int
             - artifact_hash: str
             - timestamp: int
+            Records that fail to decode are always error dicts, unless
+            ``domain_filter`` is set.
 
         Raises
         ------
@@ -60,11 +145,22 @@ class ARC4Decoder:
             If decoding fails critically.
         """
         if not raw:
-            return []
+            return
+        # Strings decode fastest from bytes, so other buffers are copied
+        # exactly once here; records are then decoded in place by offset,
+        # never sliced out.
+        if not isinstance(raw, bytes):
+            raw = bytes(raw)
 
-        records: list[dict[str, Any]] = []
         offset = 0
         data_len = len(raw)
+        consecutive_failures = 0
+        dump_hex = logger.isEnabledFor(logging.DEBUG)
+
+        # Bind hot-loop callables once instead of resolving them per record
+        unpack_len = _U16.unpack_from
+        decode_record = ARC4Decoder._decode_single_record
+        read_string = ARC4Decoder._read_arc4_string
 
         while offset < data_len:
             try:
@@ -73,7 +169,7 @@ class ARC4Decoder:
                     logger.warning("Incomplete record length at offset %d — stopping", offset)
                     break
 
-                record_len = struct.unpack(">H", raw[offset : offset + 2])[0]
+                record_len = unpack_len(raw, offset)[0]
                 offset += 2
 
                 if offset + record_len > data_len:
@@ -83,39 +179,122 @@ class ARC4Decoder:
                     )
                     break
 
-                rec_bytes = raw[offset : offset + record_len]
+                rec_start = offset
                 offset += record_len
 
+                # Match on the domain alone before decoding the rest
+                if domain_filter is not None:
+                    if record_len < 22:
+                        raise ARC4DecodingError(
+                            f"Record too short: {record_len} bytes (minimum 22 required)"
+                        )
+                    domain_offset = unpack_len(raw, rec_start + 2)[0]
+                    if read_string(raw, domain_offset, rec_start, record_len) != domain_filter:
+                        consecutive_failures = 0
+                        continue
+
                 # Decode single record
-                record = ARC4Decoder._decode_single_record(rec_bytes)
-                records.append(record)
+                record = decode_record(raw, rec_start, record_len)
+                consecutive_failures = 0
+                yield record._asdict() if as_dict else record
 
             except Exception as exc:
-                logger.error("Failed to decode record at offset %d: %s", offset, exc)
+                logger.error("Failed to decode record at offset %d: %s", rec_start, exc)
                 # Include error record for debugging
-                records.append({
-                    "decode_error": str(exc),
-                    "raw_hex": raw[max(0, offset - 100) : offset + 100].hex(),
-                    "offset": offset,
-                })
-                # Try to continue with next record
-                offset += 1
-
-        logger.debug("Decoded %d records from %d bytes", len(records), data_len)
-        return records
+                if domain_filter is None:
+                    error_record: dict[str, Any] = {"decode_error": str(exc), "offset": rec_start}
+                    if dump_hex:
+                        error_record["raw_hex"] = raw[rec_start : rec_start + record_len].hex()
+                    yield error_record
+
+                # The length prefix framed the record, so `offset` already
+                # points at the next one; only stop if the box looks corrupt.
+                consecutive_failures += 1
+                if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                    logger.error(
+                        "%d consecutive undecodable records at offset %d — stopping",
+                        consecutive_failures, offset
+                    )
+                    break
+
+    @staticmethod
+    def decode_skill_records_columnar(raw: bytes) -> dict[str, Any]:
+        """Decode SkillRecords into per-field columns (struct-of-arrays).
+
+        Parameters
+        ----------
+        raw : bytes
+            Raw bytes from Algorand Box storage.
+
+        Returns
+        -------
+        dict
+            Columns of equal length, one entry per valid record:
+            - modes, domains, artifact_hashes: list[str]
+            - scores, timestamps: array('Q') — contiguous uint64 buffers,
+              usable directly or via ``numpy.frombuffer`` without copying.
+            Records that fail to decode are skipped.
+        """
+        records = [
+            rec for rec in ARC4Decoder.iter_skill_records(raw, as_dict=False)
+            if isinstance(rec, SkillRecord)
+        ]
+        modes, domains, scores, artifact_hashes, timestamps = (
+            zip(*records) if records else ((), (), (), (), ())
+        )
+        return {
+            "modes": list(modes),
+            "domains": list(domains),
+            "scores": array("Q", scores),
+            "artifact_hashes": list(artifact_hashes),
+            "timestamps": array("Q", timestamps),
+        }
 
     @staticmethod
-    def _decode_single_record(rec: bytes) -> dict[str, Any]:
+    def count_records(raw: bytes) -> int:
+        """Count length-prefixed records without decoding them.
+
+        Walks the prefixes the same way the contract's ``get_record_count``
+        does; a truncated trailing record is not counted.
+
+        Parameters
+        ----------
+        raw : bytes-like
+            Raw bytes from Algorand Box storage.
+
+        Returns
+        -------
+        int
+            Number of complete length-prefixed records.
+        """
+        unpack_len = _U16.unpack_from
+        data_len = len(raw)
+        count = offset = 0
+        while offset + 2 <= data_len:
+            offset += 2 + unpack_len(raw, offset)[0]
+            if offset > data_len:
+                break
+            count += 1
+        return count
+
+    @staticmethod
+    def _decode_single_record(
+        rec: bytes, base: int = 0, size: int | None = None
+    ) -> SkillRecord:
         """Decode a single ARC-4 SkillRecord struct.
 
         Parameters
         ----------
         rec : bytes
-            Single record bytes (without length prefix).
+            Buffer holding the record (without length prefix).
+        base : int
+            Offset of the record within ``rec``.
+        size : int, optional
+            Record length; defaults to the rest of ``rec``.
 
         Returns
         -------
-        dict
+        SkillRecord
             Decoded record fields.
 
         Raises
@@ -123,39 +302,33 @@ class ARC4Decoder:
         ARC4DecodingError
             If record structure is invalid.
         """
-        if len(rec) < 22:
+        if size is None:
+            size = len(rec) - base
+        if size < 22:
             raise ARC4DecodingError(
-                f"Record too short: {len(rec)} bytes (minimum 22 required)"
+                f"Record too short: {size} bytes (minimum 22 required)"
             )
 
         try:
             # Parse static header (22 bytes)
-            mode_offset = struct.unpack(">H", rec[0:2])[0]
-            domain_offset = struct.unpack(">H", rec[2:4])[0]
-            score = struct.unpack(">Q", rec[4:12])[0]
-            artifact_offset = struct.unpack(">H", rec[12:14])[0]
-            timestamp = struct.unpack(">Q", rec[14:22])[0]
+            (
+                mode_offset, domain_offset, score, artifact_offset, timestamp
+            ) = _HEADER.unpack_from(rec, base)
 
             # Validate offsets
-            if mode_offset >= len(rec):
+            if mode_offset >= size:
                 raise ARC4DecodingError(f"Invalid mode_offset: {mode_offset}")
-            if domain_offset >= len(rec):
+            if domain_offset >= size:
                 raise ARC4DecodingError(f"Invalid domain_offset: {domain_offset}")
-            if artifact_offset >= len(rec):
+            if artifact_offset >= size:
                 raise ARC4DecodingError(f"Invalid artifact_offset: {artifact_offset}")
 
             # Decode dynamic strings
-            mode = ARC4Decoder._read_arc4_string(rec, mode_offset)
-            domain = ARC4Decoder._read_arc4_string(rec, domain_offset)
-            artifact_hash = ARC4Decoder._read_arc4_string(rec, artifact_offset)
-
-            return {
-                "mode": mode,
-                "domain": domain,
-                "score": score,
-                "artifact_hash": artifact_hash,
-                "timestamp": timestamp,
-            }
+            mode = ARC4Decoder._read_arc4_string(rec, mode_offset, base, size)
+            domain = ARC4Decoder._read_arc4_string(rec, domain_offset, base, size)
+            artifact_hash = ARC4Decoder._read_arc4_string(rec, artifact_offset, base, size)
+
+            return SkillRecord(mode, domain, score, artifact_hash, timestamp)
 
         except struct.error as exc:
             raise ARC4DecodingError(f"Struct unpacking failed: {exc}") from exc
@@ -163,15 +336,21 @@ class ARC4Decoder:
             raise ARC4DecodingError(f"Record decoding failed: {exc}") from exc
 
     @staticmethod
-    def _read_arc4_string(data: bytes, offset: int) -> str:
+    def _read_arc4_string(
+        data: bytes, offset: int, base: int = 0, size: int | None = None
+    ) -> str:
         """Read ARC-4 encoded string from data at offset.
 
         Parameters
         ----------
         data : bytes
-            Full record bytes.
+            Buffer holding the record.
         offset : int
-            Offset to string data.
+            Offset to string data, relative to ``base``.
+        base : int
+            Offset of the record within ``data``.
+        size : int, optional
+            Record length; defaults to the rest of ``data``.
 
         Returns
         -------
@@ -183,20 +362,26 @@ class ARC4Decoder:
         ARC4DecodingError
             If string cannot be decoded.
         """
-        if offset + 2 > len(data):
+        if size is None:
+            size = len(data) - base
+        if offset + 2 > size:
             raise ARC4DecodingError(
                 f"String length prefix out of bounds at offset {offset}"
             )
 
         try:
-            str_len = struct.unpack(">H", data[offset : offset + 2])[0]
+            start = base + offset + 2
+            str_len = _U16.unpack_from(data, start - 2)[0]
 
-            if offset + 2 + str_len > len(data):
+            if offset + 2 + str_len > size:
                 raise ARC4DecodingError(
-                    f"String data out of bounds: offset={offset}, len={str_len}, data_len={len(data)}"
+                    f"String data out of bounds: offset={offset}, len={str_len}, data_len={size}"
                 )
 
-            str_bytes = data[offset + 2 : offset + 2 + str_len]
+            str_bytes = data[start : start + str_len]
+            # Hex hashes and the mode/domain vocabularies are ASCII
+            if str_bytes.isascii():
+                return str_bytes.decode("ascii")
             return str_bytes.decode("utf-8", errors="replace")
 
         except struct.error as exc:
@@ -205,12 +390,12 @@ class ARC4Decoder:
             raise ARC4DecodingError(f"UTF-8 decode failed: {exc}") from exc
 
     @staticmethod
-    def validate_record(record: dict[str, Any]) -> bool:
+    def validate_record(record: dict[str, Any] | SkillRecord) -> bool:
         """Validate decoded record has required fields.
 
         Parameters
         ----------
-        record : dict
+        record : dict or SkillRecord
             Decoded record.
 
         Returns
@@ -218,5 +403,12 @@ class ARC4Decoder:
         bool
             True if record is valid.
         """
-        required_fields = {"mode", "domain", "score", "artifact_hash", "timestamp"}
-        return required_fields.issubset(record.keys()) and "decode_error" not in record
+        if isinstance(record, SkillRecord):
+            return True
+        # dict_keys >= frozenset probes each key; no per-call set is built
+        return (
+            record.keys() >= ARC4Decoder._REQUIRED_KEYS
+            and "decode_error" not in record
+            and isinstance(record["score"], int)
+            and isinstance(record["timestamp"], int)
+        )
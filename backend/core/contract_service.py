@@ -17,27 +17,32 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
 import time
 from dataclasses import dataclass
+from functools import cached_property
+from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 import algokit_utils
 import base64
 from algosdk import encoding as algo_encoding
+from algosdk.logic import get_application_address
 from algokit_utils import AlgoAmount, PaymentParams
+from cachetools import LRUCache
 
 # Fix import path for smart contract artifacts
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from smart_contracts.artifacts.verified_protocol.verified_protocol_client import (
-    GetRecordCountArgs,
     GetSkillRecordsArgs,
     SubmitSkillRecordArgs,
     VerifiedProtocolClient,
 )
 
-from backend.core.algorand_client import AlgorandClientManager, get_manager
+from backend.core.algorand_client import DEFAULT_VALIDITY_WINDOW, AlgorandClientManager, get_manager
 from backend.core.arc4_decoder import ARC4Decoder
 
 logger = logging.getLogger("backend.core.contract")
@@ -76,6 +81,9 @@ def _agent_log(*, hypothesisId: str, runId: str, location: str, message: str, da
 # ─────────────────────────────────────────────────────────────────────────────
 APP_ID = 755779875
 MBR_FUNDING_AMOUNT = 500_000  # 0.5 ALGO in microAlgos
+DECODED_CACHE_SIZE = 1024  # (wallet, box length) → decoded records
+MAX_GROUP_SIZE = 16  # Algorand atomic group limit
+TIMELINE_DATE_FORMAT = "%b %d, %Y • %H:%M UTC"
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -95,7 +103,7 @@ class SubmissionResult:
 class RecordQueryResult:
     """Result of record query."""
     wallet: str
-    record_count: int
+    record_count: int  # records stored in the wallet's box, per the length prefixes
     records: list[dict[str, Any]]
     success: bool
     error: str | None = None
@@ -125,6 +133,17 @@ class ContractService:
         self.app_id = app_id
         self._client: VerifiedProtocolClient | None = None
         self.decoder = ARC4Decoder()
+        # Boxes are append-only and never deleted, so a positive check sticks
+        self._box_exists: set[str] = set()
+        # Boxes only ever grow, so (wallet, box length) pins the contents
+        self._decoded: LRUCache[tuple[str, int], tuple[list[dict[str, Any]], int]] = LRUCache(
+            maxsize=DECODED_CACHE_SIZE
+        )
+        # Records are append-only, so (wallet, record count) pins the timeline
+        self._timelines: LRUCache[tuple[str, int], list[dict[str, Any]]] = LRUCache(
+            maxsize=DECODED_CACHE_SIZE
+        )
+        self._decoded_lock = threading.Lock()
 
     @property
     def client(self) -> VerifiedProtocolClient:
@@ -154,6 +173,11 @@ class ContractService:
             )
         return self._client
 
+    @cached_property
+    def app_address(self) -> str:
+        """Application account address, derived once from the app ID."""
+        return get_application_address(self.app_id)
+
     def submit_skill_record(
         self,
         mode: str,
@@ -186,14 +210,7 @@ class ContractService:
             timestamp = int(time.time())
 
         try:
-            # Step 1: Fund MBR for Box storage (with box existence check)
-            start_time = time.time()
-            logger.info("Funding Box MBR for skill record submission")
-            self._fund_box_mbr(wallet=self.manager.deployer_address)
-            funding_duration = time.time() - start_time
-            logger.info("[PERF] box_mbr_funding: %.2fs", funding_duration)
-
-            # Step 2: Submit skill record
+            # MBR funding (if the box is new) and the record go in one atomic group
             args = SubmitSkillRecordArgs(
                 mode=mode,
                 domain=domain,
@@ -205,18 +222,19 @@ class ContractService:
             send_params = self.manager.create_send_params()
 
             def submit_txn():
-                return self.client.send.submit_skill_record(
-                    args=args,
-                    send_params=send_params,
-                )
+                return self._submit_group(args).send(send_params)
 
             result = self.manager.send_and_confirm(
                 submit_txn,
                 operation_name="submit_skill_record"
             )
 
-            tx_id = result.tx_ids[0] if result.tx_ids else "unknown"
-            confirmed_round = getattr(result, "confirmed_round", None)
+            # The app call is the last member of the group
+            tx_id = result.tx_ids[-1] if result.tx_ids else "unknown"
+            confirmed_round = (
+                result.confirmations[-1].get("confirmed-round") if result.confirmations else None
+            )
+            self._box_exists.add(self.manager.deployer_address)
             explorer_url = f"https://testnet.explorer.perawallet.app/tx/{tx_id}"
 
             logger.info(
@@ -273,15 +291,8 @@ class ContractService:
             timestamp = int(time.time())
 
         try:
-            start_time = time.time()
-            
-            # Step 1: Fund MBR for Box storage (with box existence check)
-            logger.info("Funding Box MBR for skill record submission")
-            self._fund_box_mbr(wallet=self.manager.deployer_address)
-            funding_duration = time.time() - start_time
-            logger.info("[PERF] box_mbr_funding: %.2fs", funding_duration)
-
-            # Step 2: Submit skill record (async - no confirmation wait)
+            # MBR funding (if the box is new) and the record go in one
+            # atomic group (async - no confirmation wait)
             args = SubmitSkillRecordArgs(
                 mode=mode,
                 domain=domain,
@@ -293,10 +304,7 @@ class ContractService:
             send_params = self.manager.create_send_params()
 
             def submit_txn():
-                return self.client.send.submit_skill_record(
-                    args=args,
-                    send_params=send_params,
-                )
+                return self._submit_group(args).send(send_params)
 
             submit_start = time.time()
             result, tx_id = self.manager.send_transaction(
@@ -305,6 +313,7 @@ class ContractService:
             )
             submit_duration = time.time() - submit_start
             logger.info("[PERF] submit_txn: %.2fs", submit_duration)
+            self._box_exists.add(self.manager.deployer_address)
 
             explorer_url = f"https://testnet.explorer.perawallet.app/tx/{tx_id}"
 
@@ -330,18 +339,86 @@ class ContractService:
                 error=str(exc),
             )
 
-    def get_skill_records(self, wallet: str) -> RecordQueryResult:
+    def submit_skill_records_batch(
+        self, records: list[SubmitSkillRecordArgs]
+    ) -> list[SubmissionResult]:
+        """Submit several skill records in as few atomic groups as possible.
+
+        Records are packed ``MAX_GROUP_SIZE - 1`` per group (one slot stays
+        free for the MBR payment), so each group confirms in a single round.
+
+        Parameters
+        ----------
+        records : list[SubmitSkillRecordArgs]
+            Records to submit, in order.
+
+        Returns
+        -------
+        list[SubmissionResult]
+            One result per record, in input order. Every record in a failed
+            group carries that group's error.
+        """
+        results: list[SubmissionResult] = []
+        send_params = self.manager.create_send_params()
+        step = MAX_GROUP_SIZE - 1
+
+        for start in range(0, len(records), step):
+            chunk = records[start : start + step]
+            try:
+                group_start = time.time()
+                result = self.manager.send_and_confirm(
+                    lambda chunk=chunk: self._submit_group(*chunk).send(send_params),
+                    operation_name=f"submit_skill_records_batch[{start}:{start + len(chunk)}]",
+                )
+                logger.info("[PERF] submit_group(%d): %.2fs", len(chunk), time.time() - group_start)
+                self._box_exists.add(self.manager.deployer_address)
+
+                # App calls are the trailing group members, in record order
+                tx_ids = result.tx_ids[-len(chunk):]
+                confirmations = result.confirmations[-len(chunk):]
+                for tx_id, confirmation in zip(tx_ids, confirmations):
+                    results.append(SubmissionResult(
+                        success=True,
+                        transaction_id=tx_id,
+                        confirmed_round=confirmation.get("confirmed-round"),
+                        explorer_url=f"https://testnet.explorer.perawallet.app/tx/{tx_id}",
+                    ))
+
+            except Exception as exc:
+                logger.error("Batch submission failed for records %d+: %s", start, exc, exc_info=True)
+                results.extend(
+                    SubmissionResult(
+                        success=False,
+                        transaction_id="",
+                        confirmed_round=None,
+                        explorer_url="",
+                        error=str(exc),
+                    )
+                    for _ in chunk
+                )
+
+        return results
+
+    def get_skill_records(self, wallet: str, domain: str | None = None) -> RecordQueryResult:
         """Retrieve and decode all skill records for a wallet.
 
         Parameters
         ----------
         wallet : str
             Algorand wallet address.
+        domain : str, optional
+            Only return valid records for this domain. Unless the full
+            decode is already cached, non-matching records are skipped
+            at decode time.
 
         Returns
         -------
         RecordQueryResult
-            Query result with decoded records.
+            Query result with decoded records. ``record_count`` is the
+            number of records stored in the box, counted from the length
+            prefixes as the contract's ``get_record_count`` does. It covers
+            the whole wallet even when ``domain`` narrows ``records``, and
+            includes records that fail to decode.
         """
         try:
             # region agent log
@@ -388,33 +465,68 @@ class ContractService:
                 box = algod.application_box_by_name(self.app_id, wallet_key)
                 # algod returns base64 in "value"
                 raw_b64 = box.get("value", "")
-                raw_bytes = base64.b64decode(raw_b64) if isinstance(raw_b64, str) else bytes(raw_b64)
+                if isinstance(raw_b64, str):
+                    raw_bytes = base64.b64decode(raw_b64)
+                elif isinstance(raw_b64, (bytes, bytearray, memoryview)):
+                    raw_bytes = raw_b64  # already a buffer; the decoder takes it as-is
+                else:
+                    raw_bytes = bytes(raw_b64)
             except Exception as exc:
-                # If box doesn't exist, treat as zero records
-                msg = str(exc).lower()
-                if "box" in msg and ("not found" in msg or "does not exist" in msg or "404" in msg):
+                # If box doesn't exist, treat as zero records (algod answers 404)
+                if getattr(exc, "code", None) == 404:
                     raw_bytes = b""
                 else:
-                    raise
+                    msg = str(exc).lower()
+                    if "box" in msg and ("not found" in msg or "does not exist" in msg or "404" in msg):
+                        raw_bytes = b""
+                    else:
+                        raise
+
+            # Step 3: Decode records (reused while the box has not grown)
+            cache_key = (wallet, len(raw_bytes))
+            with self._decoded_lock:
+                cached = self._decoded.get(cache_key)
+
+            if domain is not None:
+                if cached is None:
+                    # Partial decode — not cached, it is not the full record set
+                    records = self.decoder.decode_skill_records(raw_bytes, domain_filter=domain)
+                    record_count = self.decoder.count_records(raw_bytes)
+                else:
+                    records = [
+                        r for r in cached[0]
+                        if r.get("domain") == domain and self.decoder.validate_record(r)
+                    ]
+                    record_count = cached[1]
+                return RecordQueryResult(
+                    wallet=wallet,
+                    record_count=record_count,
+                    records=records,
+                    success=True,
+                )
 
-            # Step 3: Decode records
-            records = self.decoder.decode_skill_records(raw_bytes)
+            if cached is None:
+                records = self.decoder.decode_skill_records(raw_bytes)
+                record_count = self.decoder.count_records(raw_bytes)
 
-            # Filter out error records for count validation
-            valid_records = [r for r in records if self.decoder.validate_record(r)]
+                logger.info(
+                    "✓ Retrieved %d records (%d valid) for wallet %s",
+                    record_count,
+                    sum(1 for r in records if self.decoder.validate_record(r)),
+                    wallet[:12] + "...",
+                )
+                with self._decoded_lock:
+                    self._decoded[cache_key] = (records, record_count)
+            else:
+                records, record_count = cached
+                logger.debug("Decoded records cache hit for wallet %s", wallet[:12] + "...")
 
-            record_count = len(valid_records)
             logger.info("Wallet %s has %d records", wallet[:12] + "...", record_count)
 
-            logger.info(
-                "✓ Retrieved %d records (%d valid) for wallet %s",
-                len(records), len(valid_records), wallet[:12] + "..."
-            )
-
             return RecordQueryResult(
                 wallet=wallet,
                 record_count=record_count,
-                records=records,
+                records=list(records),
                 success=True,
             )
 
@@ -437,9 +549,59 @@ class ContractService:
                 error=str(exc),
             )
 
+    def get_timeline(self, wallet: str) -> RecordQueryResult:
+        """Retrieve a wallet's records as chronological timeline events.
+
+        Events are sorted by timestamp and carry a preformatted
+        ``date_display``; the built list is cached until the wallet gains
+        a record.
+
+        Parameters
+        ----------
+        wallet : str
+            Wallet address.
+
+        Returns
+        -------
+        RecordQueryResult
+            Query result whose ``records`` are timeline event dicts.
+        """
+        result = self.get_skill_records(wallet)
+        if not result.success:
+            return result
+
+        cache_key = (wallet, len(result.records))
+        with self._decoded_lock:
+            events = self._timelines.get(cache_key)
+
+        if events is None:
+            events = [
+                {
+                    "domain": rec.get("domain", "unknown"),
+                    "score": rec.get("score", 0),
+                    "mode": rec.get("mode", "unknown"),
+                    "timestamp": rec.get("timestamp", 0),
+                    "artifact_hash": rec.get("artifact_hash", ""),
+                }
+                for rec in result.records
+            ]
+            events.sort(key=itemgetter("timestamp"))
+            for event in events:
+                event["date_display"] = datetime.fromtimestamp(
+                    event["timestamp"], tz=timezone.utc
+                ).strftime(TIMELINE_DATE_FORMAT)
+            with self._decoded_lock:
+                self._timelines[cache_key] = events
+
+        result.records = list(events)
+        return result
+
     def _check_box_exists(self, wallet: str) -> bool:
         """Check if wallet box already exists.
 
+        Reads the box straight from algod (one GET, no transaction) and
+        memoizes positive answers per wallet.
+
         Parameters
         ----------
         wallet : str
@@ -450,18 +612,52 @@ class ContractService:
         bool
             True if box exists, False otherwise.
         """
-        try:
-            send_params = self.manager.create_send_params()
-
-            def get_count():
-                return self.client.call.get_record_count(
-                    args=GetRecordCountArgs(wallet=wallet)
-                )
-
-            count_result = get_count()
+        if wallet in self._box_exists:
             return True
+        try:
+            self.manager.client.client.algod.application_box_by_name(
+                self.app_id, algo_encoding.decode_address(wallet)
+            )
         except Exception:
             return False
+        self._box_exists.add(wallet)
+        return True
+
+    def _mbr_payment_params(self) -> PaymentParams:
+        """Payment from the deployer covering one wallet box's MBR."""
+        return PaymentParams(
+            amount=AlgoAmount(micro_algo=MBR_FUNDING_AMOUNT),
+            sender=self.manager.deployer_address,
+            receiver=self.app_address,
+            validity_window=DEFAULT_VALIDITY_WINDOW,
+        )
+
+    def _submit_group(self, *records: SubmitSkillRecordArgs) -> Any:
+        """Compose the submission group for the deployer's box.
+
+        Prepends the MBR payment only while the box does not yet exist, so
+        funding and the records land in the same block under one send.
+
+        Parameters
+        ----------
+        *records : SubmitSkillRecordArgs
+            Records to submit, at most ``MAX_GROUP_SIZE - 1``.
+
+        Returns
+        -------
+        VerifiedProtocolComposer
+            Unsent composer; build a fresh one per send attempt.
+        """
+        group = self.client.new_group()
+        if not self._check_box_exists(self.manager.deployer_address):
+            logger.info("Box not found — funding MBR in the submission group")
+            group.composer().add_payment(self._mbr_payment_params())
+        batched = len(records) > 1
+        for index, args in enumerate(records):
+            # Identical records would otherwise be identical txns within the group
+            params = algokit_utils.CommonAppCallParams(note=b"%d" % index) if batched else None
+            group = group.submit_skill_record(args=args, params=params)
+        return group
 
     def _fund_box_mbr(self, wallet: str | None = None) -> None:
         """Fund Box Minimum Balance Requirement (Idempotent).
@@ -481,12 +677,7 @@ class ContractService:
             return
 
         try:
-            payment_params = PaymentParams(
-                amount=AlgoAmount(micro_algo=MBR_FUNDING_AMOUNT),
-                sender=self.manager.deployer_address,
-                receiver=self.client.app_address,
-                validity_window=1000,
-            )
+            payment_params = self._mbr_payment_params()
 
             send_params = self.manager.create_send_params()
 
@@ -16,12 +16,14 @@ Reputation Protocol. Routes through modular routers for:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
-from dotenv import load_dotenv
 
-load_dotenv()
+from backend.core.algorand_client import close_manager, load_env
+
+load_env()
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -90,9 +92,26 @@ async def lifespan(app: FastAPI):
         },
     )
     # endregion agent log
+
+    # Build the contract service and its Algorand clients now, so the first
+    # request doesn't pay for it. A misconfigured network must not block
+    # startup — the first on-chain request will surface the error instead.
+    from backend.core.contract_service import get_contract_service
+
+    try:
+        await asyncio.to_thread(lambda: get_contract_service().client)
+        logger.info("✓ Contract service ready")
+    except Exception as exc:
+        logger.warning("Contract service warm-up failed: %s", exc)
+
     yield
     logger.info("🛑 Verified Protocol API shutting down…")
 
+    from ai_scoring import github_analyzer
+
+    await github_analyzer.aclose()
+    await close_manager()
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # App
@@ -257,6 +276,7 @@ async def root():
             ],
             "verification": [
                 "POST /verify-evidence/repo",
+                "POST /verify-evidence/repos",
                 "POST /verify-evidence/certificate",
                 "POST /verify-evidence/project",
             ],
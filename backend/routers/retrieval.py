@@ -8,17 +8,17 @@ GET /timeline/{wallet}  — Fetch records as timeline
 
 from __future__ import annotations
 
-import datetime
 import logging
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from backend.core.contract_service import get_contract_service
 
 logger = logging.getLogger("backend.retrieval")
-router = APIRouter(tags=["Retrieval"])
+router = APIRouter(tags=["Retrieval"], default_response_class=ORJSONResponse)
 
 
 class RecordItem(BaseModel):
@@ -76,24 +76,13 @@ async def get_timeline(wallet: str):
     """Fetch records as a chronological timeline."""
     try:
         service = get_contract_service()
-        result = service.get_skill_records(wallet)
+        result = service.get_timeline(wallet)
 
         if not result.success:
             raise HTTPException(status_code=502, detail=result.error)
 
-        events: list[TimelineEvent] = []
-        for rec in sorted(result.records, key=lambda r: r.get("timestamp", 0)):
-            ts = rec.get("timestamp", 0)
-            dt = datetime.datetime.fromtimestamp(ts, tz=datetime.timezone.utc)
-
-            events.append(TimelineEvent(
-                domain=rec.get("domain", "unknown"),
-                score=rec.get("score", 0),
-                mode=rec.get("mode", "unknown"),
-                timestamp=ts,
-                artifact_hash=rec.get("artifact_hash", ""),
-                date_display=dt.strftime("%b %d, %Y • %H:%M UTC"),
-            ))
+        # Sorted and formatted once per wallet state by the service
+        events = [TimelineEvent(**event) for event in result.records]
 
         return TimelineResponse(wallet=wallet, events=events)
     except HTTPException:
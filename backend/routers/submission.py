@@ -4,10 +4,12 @@ Backend Router — Submission
 
 POST /submit — Submit a skill record on-chain (after AI scoring).
 POST /submit/async — Submit asynchronously (returns immediately).
+POST /submit/batch — Submit many records in atomic groups.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 import time
@@ -15,13 +17,22 @@ import json
 from typing import Optional
 from pathlib import Path as FSPath
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
-from backend.core.contract_service import get_contract_service
+from backend.core.contract_service import SubmitSkillRecordArgs, get_contract_service
 
 logger = logging.getLogger("backend.submission")
-router = APIRouter(tags=["Submission"])
+router = APIRouter(tags=["Submission"], default_response_class=ORJSONResponse)
+
+# Background confirmation bounds for /submit/async
+CONFIRM_TIMEOUT = 30.0
+MAX_PENDING_CONFIRMATIONS = 64
+_confirm_slots = asyncio.Semaphore(MAX_PENDING_CONFIRMATIONS)
+_pending_confirmations: set[asyncio.Task] = set()  # strong refs until done
+
+MAX_BATCH_RECORDS = 150
 
 # region agent log
 _AGENT_DEBUG_LOG_PATH = FSPath(
@@ -53,6 +64,12 @@ def _agent_log(*, hypothesisId: str, runId: str, location: str, message: str, da
 # endregion agent log
 
 
+def _compute_artifact_hash(skill_id: str, score: int, timestamp: int) -> str:
+    """Default artifact hash: SHA-256 of ``skill_id:score:timestamp``."""
+    # Format straight into bytes — no intermediate str to encode
+    return hashlib.sha256(b"%s:%d:%d" % (skill_id.encode(), score, timestamp)).hexdigest()
+
+
 class SubmitRequest(BaseModel):
     skill_id: str = Field(..., description="Skill domain (e.g. 'python')")
     score: int = Field(..., ge=0, le=100)
@@ -75,6 +92,22 @@ class SubmitResponse(BaseModel):
     status: str = "confirmed"
 
 
+class BatchSubmitRequest(BaseModel):
+    records: list[SubmitRequest] = Field(..., min_length=1, max_length=MAX_BATCH_RECORDS)
+
+
+class BatchSubmitError(BaseModel):
+    index: int
+    skill_id: str
+    error: str
+
+
+class BatchSubmitResponse(BaseModel):
+    success: bool
+    submitted: list[SubmitResponse]
+    failed: list[BatchSubmitError] = []
+
+
 class AsyncSubmitResponse(BaseModel):
     success: bool
     transaction_id: str
@@ -87,12 +120,13 @@ class AsyncSubmitResponse(BaseModel):
     status: str = "submitted"
 
 
-def confirm_transaction_background(txid: str):
+async def confirm_transaction_background(txid: str):
     """Background task to confirm transaction."""
     try:
         from backend.core.algorand_client import get_manager
         manager = get_manager()
-        result = manager.wait_for_confirmation(txid, timeout=60.0)
+        async with _confirm_slots:
+            result = await manager.wait_for_confirmation_async(txid, timeout=CONFIRM_TIMEOUT)
         logger.info("✓ Background confirmation complete for txid: %s, round: %s", 
                    txid, result.get("confirmed-round"))
     except Exception as exc:
@@ -100,7 +134,7 @@ def confirm_transaction_background(txid: str):
 
 
 @router.post("/submit/async", response_model=AsyncSubmitResponse)
-async def submit_record_async(req: SubmitRequest, background_tasks: BackgroundTasks):
+async def submit_record_async(req: SubmitRequest):
     """Submit a skill attestation record on-chain (async - returns immediately)."""
     _agent_log(
         hypothesisId="H-submit-async",
@@ -112,17 +146,17 @@ async def submit_record_async(req: SubmitRequest, background_tasks: BackgroundTa
     service = get_contract_service()
 
     timestamp = int(time.time())
-    artifact_hash = req.artifact_hash or hashlib.sha256(
-        f"{req.skill_id}:{req.score}:{timestamp}".encode()
-    ).hexdigest()
+    artifact_hash = req.artifact_hash or _compute_artifact_hash(req.skill_id, req.score, timestamp)
 
     # Domain encoding: "domain:subdomain" if subdomain present
     domain = req.skill_id
     if req.subdomain:
         domain = f"{req.skill_id}:{req.subdomain}"
 
-    # Submit via contract service (async - no confirmation wait)
-    result = service.submit_skill_record_async(
+    # Submit via contract service (async - no confirmation wait); the send
+    # itself still blocks, so it runs off the event loop
+    result = await asyncio.to_thread(
+        service.submit_skill_record_async,
         mode=req.mode,
         domain=domain,
         score=req.score,
@@ -141,8 +175,10 @@ async def submit_record_async(req: SubmitRequest, background_tasks: BackgroundTa
         )
         raise HTTPException(status_code=502, detail=result.error)
 
-    # Add background task to confirm transaction
-    background_tasks.add_task(confirm_transaction_background, result.transaction_id)
+    # Confirm on the event loop without holding up the response
+    task = asyncio.create_task(confirm_transaction_background(result.transaction_id))
+    _pending_confirmations.add(task)
+    task.add_done_callback(_pending_confirmations.discard)
 
     return AsyncSubmitResponse(
         success=True,
@@ -172,7 +208,7 @@ async def prepare_submission(req: PrepareRequest):
         data={"wallet_len": len(req.wallet or "")},
     )
     service = get_contract_service()
-    service.ensure_user_mbr(req.wallet)
+    await asyncio.to_thread(service.ensure_user_mbr, req.wallet)
     return {"status": "ready", "wallet": req.wallet}
 
 
@@ -189,17 +225,17 @@ async def submit_record(req: SubmitRequest):
     service = get_contract_service()
 
     timestamp = int(time.time())
-    artifact_hash = req.artifact_hash or hashlib.sha256(
-        f"{req.skill_id}:{req.score}:{timestamp}".encode()
-    ).hexdigest()
+    artifact_hash = req.artifact_hash or _compute_artifact_hash(req.skill_id, req.score, timestamp)
 
     # Domain encoding: "domain:subdomain" if subdomain present
     domain = req.skill_id
     if req.subdomain:
         domain = f"{req.skill_id}:{req.subdomain}"
 
-    # Submit via contract service (handles MBR funding automatically)
-    result = service.submit_skill_record(
+    # Submit via contract service (handles MBR funding automatically);
+    # send and confirmation block, so they run off the event loop
+    result = await asyncio.to_thread(
+        service.submit_skill_record,
         mode=req.mode,
         domain=domain,
         score=req.score,
@@ -229,3 +265,49 @@ async def submit_record(req: SubmitRequest):
         mode=req.mode,
         status="confirmed",
     )
+
+
+@router.post("/submit/batch", response_model=BatchSubmitResponse)
+async def submit_records_batch(req: BatchSubmitRequest):
+    """Submit many skill records, packed into atomic groups."""
+    service = get_contract_service()
+    timestamp = int(time.time())
+
+    args_list: list[SubmitSkillRecordArgs] = []
+    for item in req.records:
+        artifact_hash = item.artifact_hash or _compute_artifact_hash(item.skill_id, item.score, timestamp)
+        domain = f"{item.skill_id}:{item.subdomain}" if item.subdomain else item.skill_id
+        args_list.append(SubmitSkillRecordArgs(
+            mode=item.mode,
+            domain=domain,
+            score=item.score,
+            artifact_hash=artifact_hash,
+            timestamp=timestamp,
+        ))
+
+    # Up to 10 sequential group confirmations; keep them off the event loop
+    results = await asyncio.to_thread(service.submit_skill_records_batch, args_list)
+
+    submitted: list[SubmitResponse] = []
+    failed: list[BatchSubmitError] = []
+    for index, (item, args, result) in enumerate(zip(req.records, args_list, results)):
+        if result.success:
+            submitted.append(SubmitResponse(
+                success=True,
+                transaction_id=result.transaction_id,
+                skill_id=item.skill_id,
+                score=item.score,
+                timestamp=timestamp,
+                artifact_hash=args.artifact_hash,
+                explorer_url=result.explorer_url,
+                mode=item.mode,
+                status="confirmed",
+            ))
+        else:
+            failed.append(BatchSubmitError(index=index, skill_id=item.skill_id, error=result.error or ""))
+
+    if not submitted:
+        logger.error("Batch submission failed: %s", failed[0].error)
+        raise HTTPException(status_code=502, detail=failed[0].error)
+
+    return BatchSubmitResponse(success=not failed, submitted=submitted, failed=failed)
@@ -3,6 +3,7 @@ Backend Router — Verification
 ===============================
 
 POST /verify-evidence/repo              — Verify a GitHub repo
+POST /verify-evidence/repos             — Verify several GitHub repos concurrently
 POST /verify-evidence/certificate/upload — Verify a certificate file
 POST /verify-evidence/project/upload     — Verify a project archive (ZIP)
 """
@@ -16,23 +17,31 @@ import shutil
 import tempfile
 import json
 import time
+import zipfile
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
 from pathlib import Path as FSPath
 
 from ai_scoring.github_analyzer import GitHubAnalyzer
+from ai_scoring.models import DomainDetection, VerificationSignal
 from verification_engine.certificate_verifier import CertificateVerifier
-from verification_engine.project_verifier import ProjectVerifier
+from verification_engine.project_verifier import CODE_EXTS, DOC_FILES, ProjectVerifier
 
 logger = logging.getLogger("backend.verification")
-router = APIRouter(prefix="/verify-evidence", tags=["Verification"])
+router = APIRouter(prefix="/verify-evidence", tags=["Verification"], default_response_class=ORJSONResponse)
 
 github_analyzer = GitHubAnalyzer()
 cert_v = CertificateVerifier()
 project_v = ProjectVerifier()
 
+UPLOAD_COPY_BUFSIZE = 1 << 20  # copy uploads to disk 1 MB at a time
+MAX_MEMBER_SIZE = 10 * 1024 * 1024  # skip archive members larger than this
+CERT_IN_MEMORY_LIMIT = 4 * 1024 * 1024  # smaller certificates skip the temp file
+MAX_REPOS_PER_REQUEST = 20
+
 # region agent log
 _AGENT_DEBUG_LOG_PATH = FSPath(
     r"c:\Users\Aarti Panchal\Downloads\verifi.ed-main\verifi.ed\.cursor\debug.log"
@@ -63,22 +72,91 @@ def _agent_log(*, hypothesisId: str, runId: str, location: str, message: str, da
 # endregion agent log
 
 
+def _extract_zip(archive_path: str, extract_path: str) -> str:
+    """Extract only the members ProjectVerifier looks at.
+
+    Skips oversized members and anything that would land outside
+    ``extract_path``. Returns the directory to verify: the single
+    top-level folder if every extracted member sits under one.
+    """
+    root = os.path.realpath(extract_path)
+    top_level: set[str] = set()
+    nested = False
+
+    with zipfile.ZipFile(archive_path) as zf:
+        for info in zf.infolist():
+            name = info.filename
+            if info.is_dir() or info.file_size > MAX_MEMBER_SIZE:
+                continue
+            # The containment check covers ".." components; a prefix test
+            # would also reject names like "..config/x" or "...md"
+            if name.startswith(("/", "\\")) or not os.path.realpath(
+                os.path.join(root, name)
+            ).startswith(root + os.sep):
+                logger.warning("Skipping unsafe archive member: %s", name)
+                continue
+            base = name.rsplit("/", 1)[-1].lower()
+            if os.path.splitext(base)[1] not in CODE_EXTS and base not in DOC_FILES:
+                continue
+
+            zf.extract(info, root)
+            head, sep, _ = name.partition("/")
+            top_level.add(head)
+            nested = nested or bool(sep)
+
+    if len(top_level) == 1 and nested:
+        only = os.path.join(extract_path, top_level.pop())
+        if os.path.isdir(only):
+            return only
+    return extract_path
+
+
 class RepoVerifyRequest(BaseModel):
     repo_url: str
     wallet: Optional[str] = None
     mode: str = "developer"
 
 
+class MultiRepoVerifyRequest(BaseModel):
+    urls: list[str] = Field(..., min_length=1, max_length=MAX_REPOS_PER_REQUEST)
+    wallet: Optional[str] = None
+    mode: str = "developer"
+    max_concurrency: int = Field(4, ge=1, le=8)
+
+
 class VerificationResponse(BaseModel):
     verified: bool
     overall_score: float
     source_type: str
-    signals: list[dict] = []
-    domains: list[dict] = []
+    # Model instances pass through as-is — no per-request dict rebuild
+    signals: list[VerificationSignal] = []
+    domains: list[DomainDetection] = []
     metadata: dict = {}
     error: Optional[str] = None
 
 
+def _repo_response(result: dict) -> VerificationResponse:
+    """Map a GitHubAnalyzer result onto the API response."""
+    if result.get("metadata", {}).get("error"):
+        return VerificationResponse(
+            verified=False,
+            overall_score=0.0,
+            source_type="github-repo",
+            error=result["metadata"]["error"],
+        )
+
+    score = result.get("overall_score", 0.0)
+
+    return VerificationResponse(
+        verified=score >= 0.4,
+        overall_score=score,
+        source_type="github-repo",
+        signals=result.get("signals", []),
+        domains=result.get("domains", []),
+        metadata=result.get("metadata", {}),
+    )
+
+
 @router.post("/repo", response_model=VerificationResponse)
 async def verify_repo(req: RepoVerifyRequest):
     """Verify and analyze a GitHub repository using the fast GitHubAnalyzer."""
@@ -93,40 +171,7 @@ async def verify_repo(req: RepoVerifyRequest):
 
         # Use the fast GitHubAnalyzer directly (parallel fetching + cache)
         result = await github_analyzer.analyze(req.repo_url)
-
-        if result.get("metadata", {}).get("error"):
-            return VerificationResponse(
-                verified=False,
-                overall_score=0.0,
-                source_type="github-repo",
-                error=result["metadata"]["error"],
-            )
-
-        score = result.get("overall_score", 0.0)
-
-        return VerificationResponse(
-            verified=score >= 0.4,
-            overall_score=score,
-            source_type="github-repo",
-            signals=[
-                {
-                    "signal_name": s.signal_name,
-                    "value": s.value,
-                    "max_value": s.max_value,
-                    "normalized": s.normalized,
-                    "detail": s.detail,
-                }
-                for s in result.get("signals", [])
-            ],
-            domains=[
-                {
-                    "domain": d.domain,
-                    "confidence": d.confidence,
-                }
-                for d in result.get("domains", [])
-            ],
-            metadata=result.get("metadata", {}),
-        )
+        return _repo_response(result)
     except Exception as exc:
         logger.error("Repo verification failed: %s", exc, exc_info=True)
         _agent_log(
@@ -139,6 +184,36 @@ async def verify_repo(req: RepoVerifyRequest):
         raise HTTPException(status_code=502, detail=str(exc))
 
 
+@router.post("/repos", response_model=list[VerificationResponse])
+async def verify_repos(req: MultiRepoVerifyRequest):
+    """Verify several GitHub repositories concurrently.
+
+    Results come back in request order; a repo that fails to analyze gets
+    an unverified response carrying its error instead of failing the batch.
+    """
+    slots = asyncio.Semaphore(req.max_concurrency)
+
+    async def analyze(url: str) -> dict:
+        async with slots:
+            return await github_analyzer.analyze(url)
+
+    results = await asyncio.gather(*(analyze(url) for url in req.urls), return_exceptions=True)
+
+    responses: list[VerificationResponse] = []
+    for url, result in zip(req.urls, results):
+        if isinstance(result, BaseException):
+            logger.error("Repo verification failed for %s: %s", url, result)
+            responses.append(VerificationResponse(
+                verified=False,
+                overall_score=0.0,
+                source_type="github-repo",
+                error=str(result),
+            ))
+        else:
+            responses.append(_repo_response(result))
+    return responses
+
+
 @router.post("/certificate/upload", response_model=VerificationResponse)
 async def verify_certificate_upload(
     file: UploadFile = File(...),
@@ -155,24 +230,33 @@ async def verify_certificate_upload(
             data={"filename": file.filename, "mode": mode},
         )
         suffix = os.path.splitext(file.filename or "file")[1] or ".bin"
-        # Create temp file but close it immediately so it can be re-opened by verifier on Windows
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            temp_path = tmp.name
-        # File is effectively closed here by __exit__
-
 
-        logger.info("Processing certificate: %s (%d bytes)", file.filename, len(content))
-
-        result = await cert_v.verify(temp_path)
+        # Small uploads are verified straight from memory
+        head = await file.read(CERT_IN_MEMORY_LIMIT + 1)
+        if len(head) <= CERT_IN_MEMORY_LIMIT:
+            logger.info("Processing certificate: %s (%d bytes)", file.filename, len(head))
+            result = await cert_v.verify_bytes(head, suffix)
+        else:
+            # Create temp file but close it immediately so it can be re-opened by verifier on Windows
+            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+                tmp.write(head)
+                del head
+                # C-level copy loop, off the event loop
+                await asyncio.to_thread(shutil.copyfileobj, file.file, tmp, UPLOAD_COPY_BUFSIZE)
+                total_bytes = tmp.tell()
+                temp_path = tmp.name
+            # File is effectively closed here by __exit__
+
+            logger.info("Processing certificate: %s (%d bytes)", file.filename, total_bytes)
+
+            result = await cert_v.verify(temp_path)
 
         return VerificationResponse(
             verified=result.verified,
             overall_score=result.overall_score,
             source_type=result.source_type.value,
-            signals=[s.model_dump() for s in result.signals],
-            domains=[d.model_dump() for d in result.domains_detected],
+            signals=result.signals,
+            domains=result.domains_detected,
             metadata={
                 **result.metadata,
                 "original_filename": file.filename,
@@ -216,18 +300,29 @@ async def verify_project_upload(
         temp_dir = tempfile.mkdtemp()
         archive_path = os.path.join(temp_dir, file.filename or "project.zip")
 
-        content = await file.read()
         with open(archive_path, "wb") as f:
-            f.write(content)
+            # C-level copy loop, off the event loop
+            await asyncio.to_thread(shutil.copyfileobj, file.file, f, UPLOAD_COPY_BUFSIZE)
+            total_bytes = f.tell()
 
-        logger.info("Processing project archive: %s (%d bytes)", file.filename, len(content))
+        logger.info("Processing project archive: %s (%d bytes)", file.filename, total_bytes)
 
         # Extract
         extract_path = os.path.join(temp_dir, "extracted")
         os.makedirs(extract_path, exist_ok=True)
 
         try:
-            shutil.unpack_archive(archive_path, extract_path)
+            # Decompression is blocking; keep the event loop free meanwhile
+            if zipfile.is_zipfile(archive_path):
+                extract_path = await asyncio.to_thread(_extract_zip, archive_path, extract_path)
+            else:
+                await asyncio.to_thread(shutil.unpack_archive, archive_path, extract_path)
+                # Check for single top-level folder (common in archive exports)
+                extracted_items = await asyncio.to_thread(os.listdir, extract_path)
+                if len(extracted_items) == 1:
+                    single_dir = os.path.join(extract_path, extracted_items[0])
+                    if os.path.isdir(single_dir):
+                        extract_path = single_dir
         except Exception as e:
             logger.warning("Archive extraction failed: %s", e)
             raise HTTPException(
@@ -235,21 +330,14 @@ async def verify_project_upload(
                 detail=f"Could not extract archive: {e}. Please upload a valid ZIP/TAR file."
             )
 
-        # Check for single top-level folder (common in ZIP exports)
-        extracted_items = os.listdir(extract_path)
-        if len(extracted_items) == 1:
-            single_dir = os.path.join(extract_path, extracted_items[0])
-            if os.path.isdir(single_dir):
-                extract_path = single_dir
-
         result = await project_v.verify(extract_path)
 
         return VerificationResponse(
             verified=result.verified,
             overall_score=result.overall_score,
             source_type=result.source_type.value,
-            signals=[s.model_dump() for s in result.signals],
-            domains=[d.model_dump() for d in result.domains_detected],
+            signals=result.signals,
+            domains=result.domains_detected,
             metadata={
                 **result.metadata,
                 "original_filename": file.filename,
@@ -272,6 +360,6 @@ async def verify_project_upload(
     finally:
         if temp_dir and os.path.exists(temp_dir):
             try:
-                shutil.rmtree(temp_dir)
+                await asyncio.to_thread(shutil.rmtree, temp_dir)
             except Exception:
                 pass
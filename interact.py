@@ -9,7 +9,12 @@ Usage:
     poetry run python interact.py submit <skill_id> <score> --artifact <file>
 
     poetry run python interact.py submit <skill_id> <score>
+    poetry run python interact.py submit-batch <records.json>
     poetry run python interact.py verify <skill_id>
+    poetry run python interact.py -q verify <skill_id>   # warnings/errors only
+
+    records.json is a list of {"skill_id": ..., "score": ..., "artifact": ...}
+    objects; "artifact" is optional.
 
 Environment:
     Reads .env for ALGOD_SERVER, ALGOD_PORT, ALGOD_TOKEN, and DEPLOYER_MNEMONIC.
@@ -18,16 +23,20 @@ Environment:
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
+import hashlib
+import json
 import logging
+import os
 import sys
 import time
 from pathlib import Path
 
-from hash_artifact import hash_file, hash_string
+from hash_artifact import hash_file
 
-from backend.core.algorand_client import get_manager
-from backend.core.arc4_decoder import ARC4Decoder
-from backend.core.contract_service import get_contract_service
+# The backend (algokit, httpx, pydantic) is imported on first use, so
+# --help and argument errors don't pay ~250 ms of imports.
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Logging
@@ -39,12 +48,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger("verified_protocol")
 
+_SEP = "─" * 60  # section rule for CLI output
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Initialize services
 # ─────────────────────────────────────────────────────────────────────────────
+@functools.cache
 def _init_services():
-    """Initialize Algorand manager and contract service."""
+    """Initialize Algorand manager and contract service (once per process)."""
+    from backend.core.algorand_client import get_manager
+    from backend.core.contract_service import get_contract_service
+
     env_path = Path(__file__).parent / ".env"
     manager = get_manager(env_path)
     service = get_contract_service()
@@ -56,9 +71,71 @@ def _init_services():
     return manager, service
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Artifact hash cache
+# ─────────────────────────────────────────────────────────────────────────────
+HASH_CACHE_PATH = Path.home() / ".verifi-ed" / "hash_cache.json"
+
+# absolute path → [st_mtime_ns, st_size, digest]; loaded on first use
+_HASH_CACHE: dict[str, list] | None = None
+_hash_cache_dirty = False
+
+
+def _save_hash_cache() -> None:
+    """Persist the artifact hash cache (best effort, runs at exit)."""
+    if not _hash_cache_dirty:
+        return
+    try:
+        HASH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        HASH_CACHE_PATH.write_text(json.dumps(_HASH_CACHE), encoding="utf-8")
+    except OSError as exc:
+        logger.debug("Could not save hash cache: %s", exc)
+
+
+def _hash_artifact(artifact_path: str) -> str:
+    """Hash an artifact file, reusing the digest while it is unchanged.
+
+    Keyed by absolute path and validated against mtime and size, so an
+    edited file is always re-hashed.
+    """
+    global _HASH_CACHE, _hash_cache_dirty
+    if _HASH_CACHE is None:
+        try:
+            _HASH_CACHE = json.loads(HASH_CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _HASH_CACHE = {}
+        atexit.register(_save_hash_cache)
+
+    st = os.stat(artifact_path)
+    key = os.path.abspath(artifact_path)
+    cached = _HASH_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        logger.debug("Artifact hash cache hit: %s", key)
+        return cached[2]
+
+    digest = hash_file(artifact_path)
+    _HASH_CACHE[key] = [st.st_mtime_ns, st.st_size, digest]
+    _hash_cache_dirty = True
+    return digest
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Core actions
 # ─────────────────────────────────────────────────────────────────────────────
+def _artifact_hash(
+    skill_id: str, score: int, timestamp: int, artifact_path: str | None
+) -> str:
+    """Hash the artifact file if given, otherwise derive a hash from the record."""
+    # Use real file hash if artifact provided, otherwise auto-generate
+    if artifact_path:
+        artifact_hash = _hash_artifact(artifact_path)
+        logger.info("Hashed artifact file: %s", artifact_path)
+        return artifact_hash
+    # Same digest as hash_string(f"{skill_id}:{score}:{timestamp}"),
+    # formatted straight into bytes
+    return hashlib.sha256(b"%s:%d:%d" % (skill_id.encode(), score, timestamp)).hexdigest()
+
+
 def submit_skill_record(skill_id: str, score: int, artifact_path: str | None = None) -> None:
     """Submit a new skill attestation record to the on-chain ledger.
 
@@ -75,17 +152,11 @@ def submit_skill_record(skill_id: str, score: int, artifact_path: str | None = N
 
     # Build arguments
     timestamp = int(time.time())
+    artifact_hash = _artifact_hash(skill_id, score, timestamp, artifact_path)
 
-    # Use real file hash if artifact provided, otherwise auto-generate
-    if artifact_path:
-        artifact_hash = hash_file(artifact_path)
-        logger.info("Hashed artifact file: %s", artifact_path)
-    else:
-        artifact_hash = hash_string(f"{skill_id}:{score}:{timestamp}")
-
-    logger.info("─" * 60)
+    logger.info(_SEP)
     logger.info("SUBMIT SKILL RECORD")
-    logger.info("─" * 60)
+    logger.info(_SEP)
     logger.info("  Skill ID       : %s", skill_id)
     logger.info("  Score           : %d", score)
     logger.info("  Timestamp       : %d", timestamp)
@@ -101,18 +172,80 @@ def submit_skill_record(skill_id: str, score: int, artifact_path: str | None = N
     )
 
     if result.success:
-        logger.info("─" * 60)
+        logger.info(_SEP)
         logger.info("✅ SKILL RECORD SUBMITTED SUCCESSFULLY")
-        logger.info("─" * 60)
+        logger.info(_SEP)
         logger.info("  Transaction ID  : %s", result.transaction_id)
         logger.info("  Confirmed round : %s", result.confirmed_round or "N/A")
         logger.info("  Explorer        : %s", result.explorer_url)
-        logger.info("─" * 60)
+        logger.info(_SEP)
     else:
         logger.error("❌ Submission failed: %s", result.error)
         sys.exit(1)
 
 
+def submit_many(records: list[dict]) -> None:
+    """Submit several skill records in atomic groups.
+
+    Up to 15 records share one group and so confirm in a single round,
+    instead of one round trip each.
+
+    Parameters
+    ----------
+    records : list[dict]
+        Records with ``skill_id``, ``score`` and an optional ``artifact``
+        path, as loaded from a ``submit-batch`` JSON file.
+    """
+    from backend.core.contract_service import SubmitSkillRecordArgs
+
+    _, service = _init_services()
+
+    logger.info(_SEP)
+    logger.info("SUBMIT %d SKILL RECORDS", len(records))
+    logger.info(_SEP)
+
+    timestamp = int(time.time())
+    batch = [
+        SubmitSkillRecordArgs(
+            mode="ai-graded",
+            domain=rec["skill_id"],
+            score=int(rec["score"]),
+            artifact_hash=_artifact_hash(rec["skill_id"], int(rec["score"]), timestamp, rec.get("artifact")),
+            timestamp=timestamp,
+        )
+        for rec in records
+    ]
+    results = service.submit_skill_records_batch(batch)
+
+    failures = 0
+    for i, (args, result) in enumerate(zip(batch, results), 1):
+        skill_id, score = args.domain, args.score
+        if result.success:
+            logger.info("  [%d] ✅ %s (%d) → %s", i, skill_id, score, result.transaction_id)
+        else:
+            failures += 1
+            logger.error("  [%d] ❌ %s (%d): %s", i, skill_id, score, result.error)
+
+    logger.info(_SEP)
+    logger.info("Submitted %d/%d records", len(records) - failures, len(records))
+    logger.info(_SEP)
+    if failures:
+        sys.exit(1)
+
+
+def _load_batch(path: str) -> list[dict]:
+    """Load and validate a submit-batch JSON file."""
+    records = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(records, list) or not records:
+        raise ValueError(f"{path}: expected a non-empty JSON list of records")
+    for i, rec in enumerate(records, 1):
+        if not isinstance(rec, dict) or "skill_id" not in rec or "score" not in rec:
+            raise ValueError(f"{path}: record #{i} needs 'skill_id' and 'score'")
+        if not 0 <= int(rec["score"]) <= 100:
+            raise ValueError(f"{path}: record #{i} score must be between 0 and 100")
+    return records
+
+
 def verify_skill_record(skill_id: str) -> None:
     """Verify / read all skill records for the deployer wallet.
 
@@ -124,53 +257,70 @@ def verify_skill_record(skill_id: str) -> None:
     """
     manager, service = _init_services()
 
-    logger.info("─" * 60)
+    logger.info(_SEP)
     logger.info("VERIFY SKILL RECORDS")
-    logger.info("─" * 60)
+    logger.info(_SEP)
     logger.info("  Wallet          : %s", manager.deployer_address)
     logger.info("  Filter (domain) : %s", skill_id if skill_id != "*" else "(all)")
 
-    # Get records via contract service
-    result = service.get_skill_records(manager.deployer_address)
+    # Get records via contract service; a domain filter is applied while
+    # decoding, so non-matching records are never fully parsed
+    result = service.get_skill_records(
+        manager.deployer_address, domain=skill_id if skill_id != "*" else None
+    )
 
     if not result.success:
         logger.error("❌ Failed to retrieve records: %s", result.error)
         sys.exit(1)
 
+    records = result.records
     logger.info("  Total records   : %s", result.record_count)
 
-    if not result.records:
-        logger.info("─" * 60)
+    # record_count covers the whole wallet, also when records are filtered
+    if not records and not result.record_count:
+        logger.info(_SEP)
         logger.info("ℹ️  No skill records found for this wallet.")
-        logger.info("─" * 60)
+        logger.info(_SEP)
         return
 
-    # Filter by domain if requested
-    records = result.records
-    if skill_id != "*":
-        records = [r for r in records if r.get("domain") == skill_id]
-
-    logger.info("─" * 60)
+    logger.info(_SEP)
     if not records:
         logger.info("ℹ️  No records found matching domain '%s'.", skill_id)
     else:
         logger.info("📋 SKILL RECORDS (%d found)", len(records))
-        logger.info("─" * 60)
-        for i, rec in enumerate(records, 1):
-            logger.info("")
-            logger.info("  Record #%d", i)
-            logger.info("    Mode          : %s", rec.get("mode", "?"))
-            logger.info("    Domain        : %s", rec.get("domain", "?"))
-            logger.info("    Score         : %s", rec.get("score", "?"))
-            logger.info("    Artifact Hash : %s", rec.get("artifact_hash", "?"))
-            logger.info("    Timestamp     : %s", rec.get("timestamp", "?"))
+        logger.info(_SEP)
+        _render_records(records)
 
+    logger.info(_SEP)
+    logger.info("✅ Verification complete.")
+    logger.info(_SEP)
+
+
+def _render_records(records: list[dict]) -> None:
+    """Log each record's fields, and warn about any that failed to decode.
+
+    With INFO output off (``--quiet`` or a programmatic caller's logging
+    config) only the decode warnings are produced; no fields are read.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        for rec in records:
             if rec.get("decode_error"):
                 logger.warning("    ⚠ Decode error: %s", rec["decode_error"])
+        return
 
-    logger.info("─" * 60)
-    logger.info("✅ Verification complete.")
-    logger.info("─" * 60)
+    info = logger.info
+    for i, rec in enumerate(records, 1):
+        get = rec.get
+        info("")
+        info("  Record #%d", i)
+        info("    Mode          : %s", get("mode", "?"))
+        info("    Domain        : %s", get("domain", "?"))
+        info("    Score         : %s", get("score", "?"))
+        info("    Artifact Hash : %s", get("artifact_hash", "?"))
+        info("    Timestamp     : %s", get("timestamp", "?"))
+
+        if get("decode_error"):
+            logger.warning("    ⚠ Decode error: %s", rec["decode_error"])
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -181,6 +331,11 @@ def main() -> None:
         prog="interact",
         description="Verified Protocol — Algorand Testnet Interaction CLI",
     )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Only log warnings and errors",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # ── submit ───────────────────────────────────────────────────────
@@ -205,6 +360,17 @@ def main() -> None:
         help="Path to artifact file to hash (optional)",
     )
 
+    # ── submit-batch ─────────────────────────────────────────────────
+    batch_parser = subparsers.add_parser(
+        "submit-batch",
+        help="Submit every skill record listed in a JSON file",
+    )
+    batch_parser.add_argument(
+        "records_file",
+        type=str,
+        help="JSON list of {skill_id, score, artifact?} objects",
+    )
+
     # ── verify ───────────────────────────────────────────────────────
     verify_parser = subparsers.add_parser(
         "verify",
@@ -217,6 +383,8 @@ def main() -> None:
     )
 
     args = parser.parse_args()
+    if args.quiet:
+        logger.setLevel(logging.WARNING)
 
     try:
         if args.command == "submit":
@@ -225,6 +393,9 @@ def main() -> None:
                 sys.exit(1)
             submit_skill_record(args.skill_id, args.score, args.artifact)
 
+        elif args.command == "submit-batch":
+            submit_many(_load_batch(args.records_file))
+
         elif args.command == "verify":
             verify_skill_record(args.skill_id)
 
@@ -20,13 +20,15 @@ ARC-4 Decoding Note:
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import sys
 from pathlib import Path
+from typing import BinaryIO, Iterable
 
-from backend.core.algorand_client import get_manager
-from backend.core.contract_service import get_contract_service
+import orjson
+
+# The backend (algokit, httpx, pydantic) is imported on first use, so
+# --help and argument errors don't pay ~250 ms of imports.
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Logging
@@ -44,6 +46,9 @@ logger = logging.getLogger("read_records")
 # ─────────────────────────────────────────────────────────────────────────────
 def read_records(wallet_address: str) -> list[dict]:
     """Fetch and decode all skill records for a wallet."""
+    from backend.core.algorand_client import get_manager
+    from backend.core.contract_service import get_contract_service
+
     env_path = Path(__file__).parent / ".env"
     get_manager(env_path)
     service = get_contract_service()
@@ -63,6 +68,31 @@ def read_records(wallet_address: str) -> list[dict]:
     return result.records
 
 
+def write_json_array(out: BinaryIO, records: Iterable[dict], pretty: bool = False) -> int:
+    """Write records as a JSON array, one element at a time.
+
+    Produces the same bytes as ``orjson.dumps(list(records))`` (with
+    ``OPT_INDENT_2`` when ``pretty``) plus a trailing newline, but never
+    builds the whole document in memory. Returns the number of records.
+    """
+    dumps = orjson.dumps
+    option = orjson.OPT_INDENT_2 if pretty else 0
+    sep, head, tail = (b",\n  ", b"[\n  ", b"\n]\n") if pretty else (b",", b"[", b"]\n")
+
+    count = 0
+    for record in records:
+        data = dumps(record, option=option)
+        if pretty:
+            # Nest the element one level under the array; JSON strings
+            # never contain a raw newline, so this only touches layout.
+            data = data.replace(b"\n", b"\n  ")
+        out.write(sep if count else head)
+        out.write(data)
+        count += 1
+    out.write(tail if count else b"[]\n")
+    return count
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # CLI
 # ─────────────────────────────────────────────────────────────────────────────
@@ -93,14 +123,15 @@ def main() -> None:
     try:
         records = read_records(args.wallet)
 
-        indent = 2 if args.pretty else None
-        json_str = json.dumps(records, indent=indent, ensure_ascii=False)
-
+        # Stream the array record by record instead of serialising the
+        # whole document first; peak memory stays at one encoded record.
         if args.output:
-            Path(args.output).write_text(json_str, encoding="utf-8")
-            logger.info("Written %d records to %s", len(records), args.output)
+            with open(args.output, "wb") as fh:
+                count = write_json_array(fh, records, args.pretty)
+            logger.info("Written %d records to %s", count, args.output)
         else:
-            print(json_str)
+            write_json_array(sys.stdout.buffer, records, args.pretty)
+            sys.stdout.flush()
 
     except KeyboardInterrupt:
         sys.exit(130)
@@ -201,7 +201,7 @@ def test_api_structure():
     try:
         from backend.main import app
         
-        routes = [route.path for route in app.routes]
+        routes = {route.path for route in app.routes}
         
         required_endpoints = [
             "/",
@@ -219,10 +219,11 @@ def test_api_structure():
             "/verify/{wallet}",
         ]
         
-        for endpoint in required_endpoints:
-            if endpoint not in routes:
+        missing = [endpoint for endpoint in required_endpoints if endpoint not in routes]
+        if missing:
+            for endpoint in missing:
                 print(f"  ✗ Missing endpoint: {endpoint}")
-                return False
+            return False
         
         print(f"  ✓ All {len(required_endpoints)} required endpoints present")
         return True
@@ -0,0 +1,23 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.core import algorand_client as ac
+
+
+def test_close_manager_releases_the_pooled_algod_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    algod = ac._PooledAlgodClient("a" * 64, "http://localhost:4001")
+    session = algod.session
+    manager = ac.AlgorandClientManager.__new__(ac.AlgorandClientManager)
+    manager._http = None
+    manager._client = SimpleNamespace(client=SimpleNamespace(algod=algod))
+    monkeypatch.setattr(ac, "_manager", manager)
+
+    # Act
+    asyncio.run(ac.close_manager())
+
+    # Assert
+    assert session.is_closed
+    assert algod.session is not session
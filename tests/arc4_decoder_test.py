@@ -0,0 +1,82 @@
+import struct
+
+from backend.core.arc4_decoder import MAX_CONSECUTIVE_FAILURES, ARC4Decoder, SkillRecord
+
+# A 22-byte header whose string offsets all point past the record
+CORRUPT_RECORD = b"\x00\x16" + b"\xff" * 22
+
+
+def arc4_string(value: str) -> bytes:
+    data = value.encode()
+    return struct.pack(">H", len(data)) + data
+
+
+def encode_record(mode: str, domain: str, score: int, artifact_hash: str, timestamp: int) -> bytes:
+    mode_b, domain_b, hash_b = arc4_string(mode), arc4_string(domain), arc4_string(artifact_hash)
+    body = struct.pack(
+        ">HHQHQ", 22, 22 + len(mode_b), score, 22 + len(mode_b) + len(domain_b), timestamp
+    ) + mode_b + domain_b + hash_b
+    return struct.pack(">H", len(body)) + body
+
+
+def test_domain_filter_returns_only_matching_records() -> None:
+    # Arrange
+    raw = b"".join(
+        encode_record("ai-graded", domain, score, "h", 1)
+        for domain, score in [("python", 1), ("web", 2), ("python", 3), ("pythonic", 4)]
+    )
+
+    # Act
+    records = ARC4Decoder.decode_skill_records(raw, domain_filter="python")
+
+    # Assert
+    assert [r["score"] for r in records] == [1, 3]
+    assert all(ARC4Decoder.validate_record(r) for r in records)
+
+
+def test_domain_filter_drops_undecodable_records() -> None:
+    # Arrange
+    raw = encode_record("ai-graded", "python", 1, "h", 1) + CORRUPT_RECORD
+
+    # Act
+    unfiltered = ARC4Decoder.decode_skill_records(raw)
+    filtered = ARC4Decoder.decode_skill_records(raw, as_dict=False, domain_filter="python")
+
+    # Assert
+    assert "decode_error" in unfiltered[1]
+    assert filtered == [SkillRecord("ai-graded", "python", 1, "h", 1)]
+
+
+def test_decoding_stops_after_max_consecutive_failures() -> None:
+    # Arrange
+    raw = CORRUPT_RECORD * MAX_CONSECUTIVE_FAILURES + encode_record("ai-graded", "python", 1, "h", 1)
+
+    # Act
+    records = ARC4Decoder.decode_skill_records(raw)
+
+    # Assert
+    assert len(records) == MAX_CONSECUTIVE_FAILURES
+    assert all("decode_error" in r for r in records)
+
+
+def test_a_good_record_resets_the_failure_count() -> None:
+    # Arrange
+    good = encode_record("ai-graded", "python", 1, "h", 1)
+    raw = (CORRUPT_RECORD * (MAX_CONSECUTIVE_FAILURES - 1) + good) * 2
+
+    # Act
+    records = ARC4Decoder.decode_skill_records(raw)
+
+    # Assert
+    assert len(records) == 2 * MAX_CONSECUTIVE_FAILURES
+    assert sum(ARC4Decoder.validate_record(r) for r in records) == 2
+
+
+def test_count_records_walks_length_prefixes() -> None:
+    # Arrange
+    raw = encode_record("ai-graded", "python", 1, "h", 1) + CORRUPT_RECORD
+
+    # Act / Assert
+    assert ARC4Decoder.count_records(raw) == 2
+    assert ARC4Decoder.count_records(raw[:-1]) == 1
+    assert ARC4Decoder.count_records(b"") == 0
@@ -0,0 +1,64 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from backend.routers import verification
+from verification_engine.certificate_verifier import CertificateVerifier
+
+CONTENT = b"%PDF-1.4 " + b"x" * 10_000
+
+
+def signal_scores(body: dict) -> dict[str, float]:
+    return {s["signal_name"]: s["normalized"] for s in body["signals"]}
+
+
+def upload(filename: str) -> dict:
+    app = FastAPI()
+    app.include_router(verification.router)
+
+    async def post() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(
+                "/verify-evidence/certificate/upload", files={"file": (filename, CONTENT)}
+            )
+
+    response = asyncio.run(post())
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_in_memory_and_temp_file_scoring_match(tmp_path: Path) -> None:
+    # Arrange
+    cert_file = tmp_path / "tmpab12cd34.pdf"
+    cert_file.write_bytes(CONTENT)
+    verifier = CertificateVerifier()
+
+    # Act
+    from_disk = asyncio.run(verifier.verify(str(cert_file)))
+    from_memory = asyncio.run(verifier.verify_bytes(CONTENT, ".pdf"))
+
+    # Assert
+    assert [s.normalized for s in from_memory.signals] == [s.normalized for s in from_disk.signals]
+    assert from_memory.overall_score == from_disk.overall_score
+    assert from_disk.metadata["file_path"] == str(cert_file)
+    assert "file_path" not in from_memory.metadata
+
+
+@pytest.mark.parametrize("limit", [verification.CERT_IN_MEMORY_LIMIT, 1024])
+def test_upload_name_does_not_change_the_score(monkeypatch: pytest.MonkeyPatch, limit: int) -> None:
+    # Arrange: the small limit sends the upload through the temp-file path
+    monkeypatch.setattr(verification, "CERT_IN_MEMORY_LIMIT", limit)
+
+    # Act
+    keyword_name = upload("certificate.pdf")
+    generic_name = upload("scan.pdf")
+
+    # Assert
+    assert signal_scores(keyword_name) == signal_scores(generic_name)
+    assert signal_scores(keyword_name)["name_plausibility"] == 0.4
+    assert keyword_name["overall_score"] == generic_name["overall_score"]
+    assert keyword_name["metadata"]["original_filename"] == "certificate.pdf"
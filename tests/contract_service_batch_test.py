@@ -0,0 +1,132 @@
+import asyncio
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from backend.core import contract_service as cs
+from backend.routers import submission
+
+
+class FakeManager:
+    deployer_address = "DEPLOYER"
+
+    def create_send_params(self) -> dict:
+        return {}
+
+    def send_and_confirm(self, txn_callable: Callable[[], Any], operation_name: str = "") -> Any:
+        return txn_callable()
+
+
+class FakeGroup:
+    def __init__(self, records: tuple, fail: bool) -> None:
+        self.records = records
+        self.fail = fail
+
+    def send(self, send_params: dict) -> SimpleNamespace:
+        if self.fail:
+            raise RuntimeError("group rejected")
+        # A leading MBR payment precedes the app calls in a real group
+        tx_ids = ["PAY"] + [f"TX-{args.score}" for args in self.records]
+        confirmations = [{"confirmed-round": 1}] + [{"confirmed-round": 7} for _ in self.records]
+        return SimpleNamespace(tx_ids=tx_ids, confirmations=confirmations)
+
+
+def make_args(count: int) -> list[cs.SubmitSkillRecordArgs]:
+    return [
+        cs.SubmitSkillRecordArgs(mode="ai-graded", domain="python", score=i, artifact_hash="h", timestamp=1)
+        for i in range(count)
+    ]
+
+
+@pytest.fixture()
+def service() -> cs.ContractService:
+    svc = cs.ContractService(manager=FakeManager())
+    svc.groups = []
+    svc.failing_groups = set()
+
+    def submit_group(*records: cs.SubmitSkillRecordArgs) -> FakeGroup:
+        index = len(svc.groups)
+        svc.groups.append(records)
+        return FakeGroup(records, fail=index in svc.failing_groups)
+
+    svc._submit_group = submit_group
+    return svc
+
+
+def test_batch_packs_fifteen_records_per_group(service: cs.ContractService) -> None:
+    # Act
+    service.submit_skill_records_batch(make_args(31))
+
+    # Assert
+    assert [len(group) for group in service.groups] == [15, 15, 1]
+
+
+def test_batch_results_follow_input_order(service: cs.ContractService) -> None:
+    # Arrange
+    records = make_args(20)
+
+    # Act
+    results = service.submit_skill_records_batch(records)
+
+    # Assert
+    assert [r.transaction_id for r in results] == [f"TX-{args.score}" for args in records]
+    assert all(r.success and r.confirmed_round == 7 for r in results)
+
+
+def test_failed_group_marks_only_its_records(service: cs.ContractService) -> None:
+    # Arrange
+    service.failing_groups = {1}
+
+    # Act
+    results = service.submit_skill_records_batch(make_args(40))
+
+    # Assert
+    assert [r.success for r in results] == [True] * 15 + [False] * 15 + [True] * 10
+    assert all(r.error == "group rejected" for r in results[15:30])
+    assert results[30].transaction_id == "TX-30"
+
+
+@pytest.fixture()
+def post_batch(monkeypatch: pytest.MonkeyPatch, service: cs.ContractService) -> Callable[[int], httpx.Response]:
+    monkeypatch.setattr(submission, "get_contract_service", lambda: service)
+    app = FastAPI()
+    app.include_router(submission.router)
+
+    async def post(count: int) -> httpx.Response:
+        body = {"records": [{"skill_id": "python", "score": i % 101} for i in range(count)]}
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/submit/batch", json=body)
+
+    return lambda count: asyncio.run(post(count))
+
+
+def test_batch_endpoint_reports_failures_by_index(
+    post_batch: Callable[[int], httpx.Response], service: cs.ContractService
+) -> None:
+    # Arrange
+    service.failing_groups = {1}
+
+    # Act
+    response = post_batch(16)
+
+    # Assert
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["submitted"]) == 15
+    assert [f["index"] for f in body["failed"]] == [15]
+
+
+def test_batch_endpoint_rejects_more_than_max_records(
+    post_batch: Callable[[int], httpx.Response], service: cs.ContractService
+) -> None:
+    # Act
+    response = post_batch(submission.MAX_BATCH_RECORDS + 1)
+
+    # Assert
+    assert response.status_code == 422
+    assert service.groups == []
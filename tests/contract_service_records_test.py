@@ -0,0 +1,42 @@
+import base64
+from types import SimpleNamespace
+
+import pytest
+from algosdk import account
+
+from backend.core import contract_service as cs
+from tests.arc4_decoder_test import CORRUPT_RECORD, encode_record
+
+WALLET = account.generate_account()[1]
+BOX = b"".join([
+    encode_record("ai-graded", "python", 1, "h", 1),
+    encode_record("ai-graded", "web", 2, "h", 2),
+    CORRUPT_RECORD,
+    encode_record("ai-graded", "python", 3, "h", 3),
+])
+
+
+class FakeAlgod:
+    def application_box_by_name(self, app_id: int, key: bytes) -> dict:
+        return {"value": base64.b64encode(BOX).decode()}
+
+
+@pytest.fixture()
+def service() -> cs.ContractService:
+    algod = FakeAlgod()
+    manager = SimpleNamespace(
+        client=SimpleNamespace(client=SimpleNamespace(algod=algod)), deployer_address=WALLET
+    )
+    return cs.ContractService(manager=manager)
+
+
+def test_record_count_is_the_same_with_and_without_cache(service: cs.ContractService) -> None:
+    # Act
+    cold_filtered = service.get_skill_records(WALLET, domain="python")
+    full = service.get_skill_records(WALLET)
+    warm_filtered = service.get_skill_records(WALLET, domain="python")
+
+    # Assert
+    assert cold_filtered.record_count == full.record_count == warm_filtered.record_count == 4
+    assert [r["score"] for r in cold_filtered.records] == [1, 3]
+    assert warm_filtered.records == cold_filtered.records
@@ -0,0 +1,45 @@
+import asyncio
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from ai_scoring import github_analyzer
+
+URL = f"{github_analyzer.GITHUB_API}/repos/owner/repo"
+
+
+@pytest.fixture(autouse=True)
+def mock_github(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"full_name": "owner/repo"}))
+    monkeypatch.setitem(github_analyzer._CLIENT_OPTIONS, "transport", transport)
+    monkeypatch.setattr(github_analyzer, "_USE_SYNC_CLIENT", False)
+    yield
+    asyncio.run(github_analyzer.aclose())
+
+
+async def serve_once() -> int:
+    """One app lifespan: serve a request, then shut the clients down."""
+    resp = await github_analyzer._get(URL)
+    await github_analyzer.aclose()
+    return resp.status_code
+
+
+def test_client_reopens_after_a_lifespan_closes_it() -> None:
+    # Act
+    first = asyncio.run(serve_once())
+    second = asyncio.run(serve_once())
+
+    # Assert
+    assert first == second == 200
+
+
+def test_each_event_loop_gets_its_own_client() -> None:
+    # Act
+    first = asyncio.run(github_analyzer._get(URL))
+    first_client = github_analyzer._client
+    second = asyncio.run(github_analyzer._get(URL))
+
+    # Assert
+    assert first.status_code == second.status_code == 200
+    assert github_analyzer._client is not first_client
@@ -29,8 +29,6 @@ class CertificateVerifier:
     async def verify(self, file_path: str) -> VerificationResult:
         """Verify a certificate file and return VerificationResult."""
         path = Path(file_path)
-        signals: list[VerificationSignal] = []
-        metadata: dict[str, Any] = {"file_path": file_path}
 
         # 1. File existence
         if not path.exists() or not path.is_file():
@@ -40,11 +38,30 @@ class CertificateVerifier:
                 error=f"File not found: {file_path}",
             )
 
+        return self._verify_content(path.read_bytes(), path.name, {"file_path": file_path})
+
+    async def verify_bytes(self, content: bytes, suffix: str) -> VerificationResult:
+        """Verify certificate content already held in memory.
+
+        Scored like an upload written to a temp file with this ``suffix``:
+        the name checks see a server-chosen stem, never the client's.
+        There is no server-side path, so ``file_path`` is not reported.
+        """
+        return self._verify_content(content, f"upload{suffix}", {})
+
+    def _verify_content(
+        self, content: bytes, filename: str, metadata: dict[str, Any]
+    ) -> VerificationResult:
+        """Score certificate bytes; ``filename`` drives the type and name checks."""
+        path = Path(filename)
+        signals: list[VerificationSignal] = []
+
         # 2. File integrity
-        sha256 = hashlib.sha256(path.read_bytes()).hexdigest()
+        sha256 = hashlib.sha256(content).hexdigest()
+        size = len(content)
         metadata["sha256"] = sha256
         metadata["filename"] = path.name
-        metadata["size_bytes"] = path.stat().st_size
+        metadata["size_bytes"] = size
         metadata["extension"] = path.suffix.lower()
 
         signals.append(VerificationSignal(
@@ -67,7 +84,6 @@ class CertificateVerifier:
         ))
 
         # 4. File size check
-        size = path.stat().st_size
         reasonable = 5_000 < size < 50_000_000
         signals.append(VerificationSignal(
             signal_name="file_size",
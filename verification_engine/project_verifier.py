@@ -35,6 +35,8 @@ CODE_EXTS = {
     ".rs", ".rb", ".php", ".c", ".cpp", ".cs", ".sol",
 }
 
+DOC_FILES = ("readme.md", "readme.rst", "readme.txt", "license", "license.md")
+
 
 class ProjectVerifier:
     """Verifies local project evidence."""
@@ -75,7 +77,7 @@ class ProjectVerifier:
         ))
 
         # 2. Documentation
-        doc_signals = sum(1 for f in ["readme.md", "readme.rst", "readme.txt", "license", "license.md"] if f in filenames)
+        doc_signals = sum(1 for f in DOC_FILES if f in filenames)
         signals.append(VerificationSignal(
             signal_name="documentation",
             value=doc_signals,